@@ -0,0 +1,339 @@
+"""
+File: backends.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Rendering backends for the apps: tkinter, a recording one and a null one
+"""
+from collections import Counter
+
+class TkBackend:
+    def __init__(self):
+        """
+        Draws with tkinter. Every attribute is the tkinter class or constant with the same name,
+        so an app uses the backend the same way it would use the tkinter module.
+        """
+        #tkinter is only imported when a window is really needed
+        import tkinter
+        import tkinter.font
+        self.Tk = tkinter.Tk
+        self.Canvas = tkinter.Canvas
+        self.Frame = tkinter.Frame
+        self.Button = tkinter.Button
+        self.Label = tkinter.Label
+        self.Checkbutton = tkinter.Checkbutton
+        self.Entry = tkinter.Entry
+        self.StringVar = tkinter.StringVar
+        self.BooleanVar = tkinter.BooleanVar
+        self.Font = tkinter.font.Font
+        self.W = tkinter.W
+
+
+class Variable:
+    def __init__(self, master=None, value=None):
+        """Holds a value like tkinter.StringVar and tkinter.BooleanVar"""
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class StringVar(Variable):
+    def __init__(self, master=None, value=''):
+        super().__init__(master, value)
+
+
+class BooleanVar(Variable):
+    def __init__(self, master=None, value=False):
+        super().__init__(master, value)
+
+
+class Font:
+    def __init__(self, **options):
+        """Stands for tkinter.font.Font"""
+        self.options = options
+
+
+class Widget:
+    kind = 'Widget'
+
+    def __init__(self, backend, master=None, **options):
+        """
+        Stands for a tkinter widget. It keeps its options and tells the backend
+        about every call, so the backend can record it or ignore it.
+        """
+        self.backend = backend
+        self.master = master
+        self.options = options
+        self.visible = False
+        self.backend.record(self.kind, 'create', (), options)
+
+    def __getitem__(self, key):
+        return self.options.get(key, '')
+
+    def __setitem__(self, key, value):
+        self.configure(**{key: value})
+
+    def configure(self, **options):
+        self.options.update(options)
+        self.backend.record(self.kind, 'configure', (), options)
+
+    config = configure
+
+    def grid(self, **options):
+        self.visible = True
+        self.backend.record(self.kind, 'grid', (), options)
+
+    def grid_remove(self):
+        self.visible = False
+        self.backend.record(self.kind, 'grid_remove', (), {})
+
+    def grid_propagate(self, flag):
+        pass
+
+    def rowconfigure(self, index, **options):
+        pass
+
+    def columnconfigure(self, index, **options):
+        pass
+
+    grid_rowconfigure = rowconfigure
+    grid_columnconfigure = columnconfigure
+
+    def bind(self, sequence, function):
+        self.backend.bindings[(self, sequence)] = function
+
+    def destroy(self):
+        self.visible = False
+        self.backend.record(self.kind, 'destroy', (), {})
+
+    def after(self, ms, function, *args):
+        return self.backend.schedule(ms, function, args)
+
+    def after_idle(self, function, *args):
+        return self.backend.schedule(0, function, args)
+
+    def after_cancel(self, job):
+        self.backend.jobs.pop(job, None)
+
+    def update(self):
+        pass
+
+    def mainloop(self):
+        """There is no event loop, the caller drives the app and runs the jobs"""
+        pass
+
+
+class Window(Widget):
+    kind = 'Tk'
+
+    def __init__(self, backend):
+        super().__init__(backend)
+        self.window_title = ''
+
+    def title(self, text=None):
+        if text is None:
+            return self.window_title
+        self.window_title = text
+        self.backend.record(self.kind, 'title', (text,), {})
+
+
+class Frame(Widget):
+    kind = 'Frame'
+
+
+class Button(Widget):
+    kind = 'Button'
+
+
+class Label(Widget):
+    kind = 'Label'
+
+
+class Checkbutton(Widget):
+    kind = 'Checkbutton'
+
+
+class Entry(Widget):
+    kind = 'Entry'
+
+    def __init__(self, backend, master=None, **options):
+        super().__init__(backend, master, **options)
+        self.variable = options.get('textvariable') or StringVar()
+
+    def get(self):
+        return self.variable.get()
+
+    def delete(self, first, last=None):
+        self.variable.set('')
+        self.backend.record(self.kind, 'delete', (first, last), {})
+
+
+class Canvas(Widget):
+    kind = 'Canvas'
+
+    def __init__(self, backend, master=None, **options):
+        """Keeps every item like a tkinter canvas: its type, coordinates and options"""
+        super().__init__(backend, master, **options)
+        self.items = {}
+        self.last_item = 0
+
+    def create(self, item_type, coords, options):
+        self.last_item += 1
+        self.items[self.last_item] = [item_type, list(coords), dict(options)]
+        self.backend.record(self.kind, 'create_' + item_type, coords, options)
+        return self.last_item
+
+    def create_line(self, *coords, **options):
+        return self.create('line', coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self.create('oval', coords, options)
+
+    def create_text(self, *coords, **options):
+        return self.create('text', coords, options)
+
+    def coords(self, item, *coords):
+        if not coords:
+            return self.items[item][1]
+        self.items[item][1] = list(coords)
+        self.backend.record(self.kind, 'coords', (item,) + coords, {})
+
+    def itemconfig(self, item, **options):
+        self.items[item][2].update(options)
+        self.backend.record(self.kind, 'itemconfig', (item,), options)
+
+    def find_all(self):
+        return tuple(self.items)
+
+    def delete(self, tag):
+        if tag == 'all':
+            self.items.clear()
+        else:
+            for item in [item for item, (item_type, coords, options) in self.items.items()
+                         if item == tag or tag in (options.get('tag'), options.get('tags'))]:
+                del self.items[item]
+        self.backend.record(self.kind, 'delete', (tag,), {})
+
+
+class RecordingBackend:
+    W = 'w'
+    StringVar = StringVar
+    BooleanVar = BooleanVar
+    Font = Font
+
+    def __init__(self):
+        """
+        Draws nothing. Counts every call the app makes to its widgets, keeps the list of
+        operations and keeps the jobs scheduled with after so the caller can run them.
+        """
+        self.operations = []
+        self.counts = Counter()
+        self.jobs = {}
+        self.last_job = 0
+        self.bindings = {}
+
+    def record(self, kind, method, args, options):
+        """Stores one call"""
+        self.operations.append((kind, method, args, options))
+        self.counts[kind + '.' + method] += 1
+
+    def draw_calls(self, kind=None):
+        """
+        Returns how many calls changed the window: widgets created, configured, placed or removed
+        and canvas items created, moved, changed or deleted. With kind, only the calls on that kind
+        of widget, like 'Canvas' or 'Label', are counted.
+        """
+        return sum(count for name, count in self.counts.items() if kind is None or name.split('.')[0] == kind)
+
+    def draw_calls_by_kind(self):
+        """Returns the number of calls on every kind of widget"""
+        kinds = Counter()
+        for name, count in self.counts.items():
+            kinds[name.split('.')[0]] += count
+        return kinds
+
+    def reset_counts(self):
+        """Forgets the recorded calls"""
+        self.operations.clear()
+        self.counts.clear()
+
+    def schedule(self, ms, function, args):
+        self.last_job += 1
+        self.jobs[self.last_job] = (function, args)
+        return self.last_job
+
+    def run_jobs(self, limit=1000):
+        """Runs the scheduled jobs in order, also the ones they schedule, at most limit of them.
+        Returns how many ran."""
+        ran = 0
+        while self.jobs and ran < limit:
+            job = min(self.jobs)
+            function, args = self.jobs.pop(job)
+            function(*args)
+            ran += 1
+        return ran
+
+    def Tk(self):
+        return Window(self)
+
+    def Canvas(self, master=None, **options):
+        return Canvas(self, master, **options)
+
+    def Frame(self, master=None, **options):
+        return Frame(self, master, **options)
+
+    def Button(self, master=None, **options):
+        return Button(self, master, **options)
+
+    def Label(self, master=None, **options):
+        return Label(self, master, **options)
+
+    def Checkbutton(self, master=None, **options):
+        return Checkbutton(self, master, **options)
+
+    def Entry(self, master=None, **options):
+        return Entry(self, master, **options)
+
+
+class NullCanvas(Widget):
+    kind = 'Canvas'
+
+    def __init__(self, backend, master=None, **options):
+        """Gives every item an id like a tkinter canvas but does not keep the items"""
+        super().__init__(backend, master, **options)
+        self.last_item = 0
+
+    def create(self, *coords, **options):
+        self.last_item += 1
+        return self.last_item
+
+    create_line = create
+    create_oval = create
+    create_text = create
+
+    def coords(self, item, *coords):
+        pass
+
+    def itemconfig(self, item, **options):
+        pass
+
+    def find_all(self):
+        return ()
+
+    def delete(self, tag):
+        pass
+
+
+class NullBackend(RecordingBackend):
+    """
+    Draws nothing and keeps no canvas items, for timing the logic of an app alone. The widgets
+    still keep their options, like tkinter does, because the apps read them back.
+    """
+    def record(self, kind, method, args, options):
+        pass
+
+    def Canvas(self, master=None, **options):
+        return NullCanvas(self, master, **options)
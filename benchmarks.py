@@ -0,0 +1,292 @@
+"""
+File: benchmarks.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Times the hot paths of the three apps without a window and compares them
+with the times saved in benchmark_baseline.json, which is committed with the code.
+After a change that is meant to change the times, or to move the baseline to the machine
+that runs the check, run "python benchmarks.py --save-baseline" and commit the file.
+On a machine of another kind or another Python version the check is skipped.
+Usage: python benchmarks.py [--save-baseline] [--threshold 0.25] [--repeat 11] [--retries 2] [--only NAME ...]
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import string
+import sys
+import time
+import timeit
+
+import backends
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+SYNTHETIC_WORDS = 2000 # words made up when long_wordlist.txt is not there
+
+
+NOISE_CAP = 0.25 # the noise of a benchmark never allows more than this on top of the threshold
+
+
+def run_times(function, repeat):
+    """return the time of one call of function in each of repeat runs, every run lasts at least 0.2 seconds"""
+    timer = timeit.Timer(function)
+    number = timer.autorange()[0]
+    return [seconds / number for seconds in timer.repeat(number=number, repeat=repeat)]
+
+
+def summary(times):
+    """
+    return the median of times and its noise: the interquartile range as a fraction of the median,
+    so one slow run does not change it
+    """
+    median = statistics.median(times)
+    quartiles = statistics.quantiles(times, n=4)
+    return median, (quartiles[2] - quartiles[0]) / median
+
+
+def machine():
+    """return what the times depend on besides the code, a baseline is only compared on the same kind of machine"""
+    return {'machine': platform.machine(), 'system': platform.system(),
+            'python': '.'.join(platform.python_version_tuple()[:2])}
+
+
+def make_wordy():
+    """return a Wordy game with no window, no waiting between letters and its word list"""
+    import wordle
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = wordle.Wordy(backend=backends.NullBackend())
+    game.PROCESS_GUESS_WAITTIME = 0
+    words = game.words_long
+    source = 'long_wordlist.txt'
+    if not words:
+        #the word lists are not in the repository, the same made up words are used every run
+        rng = random.Random(0)
+        words = sorted({''.join(rng.choice(string.ascii_lowercase) for i in range(game.WORD_SIZE))
+                        for j in range(SYNTHETIC_WORDS)})
+        source = f'{len(words)} synthetic words'
+    game.words_long = list(words)
+    game.words_short = list(words)
+    game.hidden_word.set(words[len(words) // 2])
+    game.start_button_bool = True
+    return game, source
+
+
+def new_round(game):
+    """Puts the game back at the first row with no hard mode history"""
+    game.row_squares = 0
+    game.game_over = False
+    game.guess_frame_full = False
+    game.guess_labels_list.clear()
+    game.word_guesslist.clear()
+    for letters in (game.correct_letters, game.letters_used_incorrect, game.letters_used_yellow):
+        for position in letters:
+            letters[position] = []
+    game.letters_used_incorrect_flat = []
+    game.letters_used_yellow_flat = []
+
+
+def guess(game, word):
+    """Types word in the keyboard and presses enter"""
+    new_round(game)
+    for letter in word.upper():
+        game.button_handler(letter)
+    game.button_handler('ENTER')
+
+
+def wordy_benchmarks(hardmode):
+    """return the function that guesses every word of the word list and what it works on"""
+    game, source = make_wordy()
+    game.hardmode_var.set(hardmode)
+    words = game.words_long
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for word in words:
+                guess(game, word)
+    return run, {'words': source}
+
+
+def chunks_benchmark(depth):
+    """the bounded memory walk the exporter uses, level by level without memoized subtrees"""
+    import lsystem
+    rule = lsystem.LSystem()
+
+    def run():
+        for segments in rule.iter_chunks(depth, 200, 380, math.pi / 2, 400 // 3):
+            pass
+    return run, {'depth': depth}
+
+
+def lsystem_benchmark(depth):
+    import lsystem
+    #a new rule every call so the memoized subtrees are built again
+    return (lambda: lsystem.LSystem().segments(depth, 200, 380, math.pi / 2, 400 // 3)), {'depth': depth}
+
+
+def build_tree_benchmark(depth):
+    """FractalTree.build_tree with the geometry and the draw calls, on a canvas that is not shown"""
+    import fractal_tree
+    tree = fractal_tree.FractalTree(backend=backends.NullBackend())
+
+    def run():
+        tree.canvas.delete('all')
+        tree.build_tree(depth, tree.x_1, tree.y_1, tree.angle, tree.canvas_height // 3)
+    return run, {'depth': depth}
+
+
+def clock_tick_benchmark(sweep):
+    """One tick, or one sweep frame, of Display_Clock on a canvas that is not shown"""
+    import display_clock
+    backend = backends.NullBackend()
+    clock = display_clock.Display_Clock(sweep=sweep, backend=backend)
+    update = clock.sweep_display if sweep else clock.time_display
+
+    def run():
+        if sweep:
+            #every frame moves the hands, like a frame a while after the last one
+            clock.shown_positions.clear()
+            clock.shown_second = None
+        update()
+        backend.jobs.clear()
+    return run, {'sweep': sweep}
+
+
+def clock_model_benchmark():
+    import clock_geometry
+    now = clock_geometry.local_seconds(time.time())
+    return (lambda: clock_geometry.hand_endpoints(now, 100, 100, 80)), {}
+
+
+# name -> function that returns the benchmark and its parameters
+BENCHMARKS = {
+    'wordy_guess_wordlist': lambda: wordy_benchmarks(False),
+    'wordy_hardmode_wordlist': lambda: wordy_benchmarks(True),
+    'clock_tick': lambda: clock_tick_benchmark(False),
+    'clock_sweep_frame': lambda: clock_tick_benchmark(True),
+    'clock_model': clock_model_benchmark,
+}
+for depth in (10, 12, 14, 16, 18, 20):
+    BENCHMARKS[f'lsystem_chunks_depth_{depth}'] = lambda depth=depth: chunks_benchmark(depth)
+    BENCHMARKS[f'lsystem_depth_{depth}'] = lambda depth=depth: lsystem_benchmark(depth)
+for depth in (10, 12, 14, 16, 18, 20):
+    BENCHMARKS[f'fractal_tree_build_tree_depth_{depth}'] = lambda depth=depth: build_tree_benchmark(depth)
+
+
+def run_benchmarks(names, repeat, times=None):
+    """
+    return the results of the benchmarks with those names. times keeps the runs of every
+    benchmark, the runs already in it are counted with the new ones.
+    """
+    if times is None:
+        times = {}
+    results = {}
+    for name in names:
+        function, params = BENCHMARKS[name]()
+        times.setdefault(name, []).extend(run_times(function, repeat))
+        seconds, noise = summary(times[name])
+        results[name] = {'seconds': seconds, 'noise': noise, 'params': params}
+        print(f"{name:<36} {seconds * 1000:>12.4f} ms  +/-{noise:.0%}")
+    return results
+
+
+def change(result, saved, threshold):
+    """
+    return how much slower result is than saved, and how much slower it is allowed to be:
+    threshold plus the noise measured when the baseline was saved, at most NOISE_CAP
+    """
+    return result['seconds'] / saved['seconds'] - 1, threshold + min(saved['noise'], NOISE_CAP)
+
+
+def compare(results, baseline, threshold, verbose=True):
+    """
+    return the names of the benchmarks that are slower than the baseline by more than they are allowed,
+    and of the ones the baseline does not have or has with other parameters, those need a new baseline
+    """
+    failures = []
+    if verbose:
+        print(f"\n{'benchmark':<36} {'baseline':>12} {'now':>12} {'change':>8} {'allowed':>8}")
+    for name, result in results.items():
+        saved = baseline.get(name)
+        if saved is None or saved['params'] != result['params']:
+            failures.append(name)
+            if verbose:
+                print(f"{name:<36} {'STALE BASELINE':>14}, saved with {saved and saved['params']}, "
+                      f"now {result['params']}")
+            continue
+        slower, allowed = change(result, saved, threshold)
+        flag = ''
+        if slower > allowed:
+            flag = '  REGRESSION'
+            failures.append(name)
+        if verbose:
+            print(f"{name:<36} {saved['seconds'] * 1000:>10.4f}ms {result['seconds'] * 1000:>10.4f}ms "
+                  f"{slower:>+7.1%} {allowed:>+7.1%}{flag}")
+    return failures
+
+
+def load_baseline(path):
+    """return the saved baseline, or None when there is none"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Time the apps without a window and compare with the baseline")
+    parser.add_argument('--save-baseline', action='store_true', help="write the results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="fail when a benchmark is this fraction slower than the baseline, on top of its noise")
+    parser.add_argument('--repeat', type=int, default=11, help="runs of every benchmark, the median is kept")
+    parser.add_argument('--retries', type=int, default=2,
+                        help="times a benchmark that looks slower is timed again, with all its runs counted together")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    args = parser.parse_args(arguments)
+
+    baseline = load_baseline(args.baseline)
+    if not args.save_baseline:
+        if baseline is None:
+            print(f"There is no baseline in {args.baseline}, run with --save-baseline and commit it")
+            return 1
+        if baseline['machine'] != machine():
+            #times from another kind of machine say nothing about this code
+            print(f"Skipped: the baseline was made on {baseline['machine']}, this is {machine()}")
+            return 0
+
+    times = {}
+    results = run_benchmarks(args.only, args.repeat, times)
+    if args.save_baseline:
+        if baseline is None or baseline['machine'] != machine():
+            baseline = {'machine': machine(), 'results': {}}
+        baseline['results'].update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\nSaved {len(results)} results in {args.baseline}")
+        return 0
+
+    #the machine can be busy for a moment, a benchmark that looks slower is timed again and
+    #the median of all its runs is used, so one busy moment does not decide the result
+    for retry in range(args.retries):
+        suspects = [name for name in compare(results, baseline['results'], args.threshold, verbose=False)
+                    if name in baseline['results'] and baseline['results'][name]['params'] == results[name]['params']]
+        if not suspects:
+            break
+        print(f"\nTiming again: {', '.join(suspects)}")
+        results.update(run_benchmarks(suspects, args.repeat, times))
+    failures = compare(results, baseline['results'], args.threshold)
+    if failures:
+        print(f"\n{len(failures)} benchmarks are slower than the baseline by more than "
+              f"{args.threshold:.0%} plus their noise, or need a new baseline: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+File: clock_geometry.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Maps a time to the end points of the clock hands, without any window
+"""
+import argparse
+import math
+import time
+import timeit
+
+HAND_LENGTHS = (0.5, 0.65, 0.8) # hour, minute and second hand as a fraction of the radius
+HAND_PERIODS = (43200, 3600, 60) # seconds for a whole turn of the hour, minute and second hand
+
+
+def local_seconds(timestamp):
+    """input: double: seconds since the epoch
+    return the same instant in seconds of local time, so whole days start at local midnight"""
+    return timestamp + time.localtime(timestamp).tm_gmtoff
+
+
+def hand_fractions(seconds):
+    """input: double: local time in seconds
+    return how much of a turn the hour, minute and second hands have done, between 0 and 1"""
+    return tuple(seconds % period / period for period in HAND_PERIODS)
+
+
+def hand_angles(seconds):
+    """input: double: local time in seconds
+    return the angles in radians of the hour, minute and second hands, 12 o'clock is -pi/2"""
+    return tuple(2 * math.pi * fraction - math.pi / 2 for fraction in hand_fractions(seconds))
+
+
+def hand_endpoints(seconds, center_x, center_y, radius):
+    """input: double: local time in seconds, double: center x, double: center y, double: radius
+    return the (x, y) end point of the hour, minute and second hands"""
+    return tuple((center_x + radius * length * math.cos(angle), center_y + radius * length * math.sin(angle))
+                 for length, angle in zip(HAND_LENGTHS, hand_angles(seconds)))
+
+
+def hand_endpoints_array(seconds, center_x, center_y, radius):
+    """input: array: local times in seconds, array: center x, array: center y, double or array: radius
+    return an array of shape (..., 3, 2) with the end points of the hour, minute and second hands
+    of every clock, all the inputs are broadcast together"""
+    #numpy is only needed for many clocks at once, the clock window does not need it
+    import numpy as np
+    seconds = np.asarray(seconds, dtype=float)[..., np.newaxis]
+    periods = np.array(HAND_PERIODS, dtype=float)
+    angles = 2 * np.pi * (seconds % periods) / periods - np.pi / 2
+    lengths = np.asarray(radius, dtype=float)[..., np.newaxis] * np.array(HAND_LENGTHS)
+    x = np.asarray(center_x, dtype=float)[..., np.newaxis] + lengths * np.cos(angles)
+    y = np.asarray(center_y, dtype=float)[..., np.newaxis] + lengths * np.sin(angles)
+    return np.stack((x, y), axis=-1)
+
+
+def benchmark(clock_counts, number=2000):
+    """input: list: number of clocks, int: ticks timed
+    print the cost of one tick of the clock model with no window"""
+    import numpy as np
+    now = local_seconds(time.time())
+    tick = timeit.timeit(lambda: hand_endpoints(now, 100, 100, 80), number=number) / number
+    print(f"one clock, scalar model: {tick * 1e6:.2f} us per tick")
+    print(f"{'clocks':>8} {'scalar':>12} {'vectorized':>12} {'per clock':>12}")
+    for count in clock_counts:
+        seconds = now + np.arange(count) * 900.0 # a different time zone for every clock
+        centers = np.arange(count) * 200.0
+        runs = max(1, number // count)
+        scalar = timeit.timeit(lambda: [hand_endpoints(s, c, 100, 80) for s, c in zip(seconds.tolist(), centers.tolist())],
+                               number=runs) / runs
+        vectorized = timeit.timeit(lambda: hand_endpoints_array(seconds, centers, 100, 80), number=runs) / runs
+        print(f"{count:>8} {scalar * 1e3:>10.3f}ms {vectorized * 1e3:>10.3f}ms {vectorized / count * 1e6:>10.3f}us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the clock model without a window")
+    parser.add_argument('--clocks', type=int, nargs='+', default=[1, 10, 100, 1000, 10000])
+    parser.add_argument('--number', type=int, default=2000)
+    args = parser.parse_args()
+    benchmark(args.clocks, args.number)
@@ -3,18 +3,95 @@
 # Date: 3/18/2022
 # Description: Display a clock with two buttons that stop and continue the timer.
 
+import argparse
 import math 
 import datetime
-import tkinter as tk
-from turtle import update
+import backends
 import time
+import clock_geometry
 
-class Display_Clock:
+class TickStats:
+    def __init__(self):
+        """
+        Counts the ticks of the clock, how late they are and how long they take
+        """
+        self.ticks = 0
+        self.skipped = 0 # seconds that never got a tick
+        self.total_jitter = 0.0
+        self.max_jitter = 0.0
+        self.total_cost = 0.0
+        self.max_cost = 0.0
+        self.last_second = None
+
+    def record(self, target, started, finished):
+        """
+        Records one tick. target is the wall clock second the tick was meant for,
+        started is the wall clock time it ran and finished - started is its cost.
+        """
+        jitter = started - target
+        cost = finished - started
+        if self.last_second is not None and int(target) - self.last_second > 1:
+            self.skipped += int(target) - self.last_second - 1
+        self.last_second = int(target)
+        self.ticks += 1
+        self.total_jitter += jitter
+        self.max_jitter = max(self.max_jitter, jitter)
+        self.total_cost += cost
+        self.max_cost = max(self.max_cost, cost)
+
+    def summary(self):
+        """Returns the statistics as a str"""
+        if self.ticks == 0:
+            return "No ticks"
+        return (f"{self.ticks} ticks, {self.skipped} skipped seconds, "
+                f"jitter mean {self.total_jitter / self.ticks * 1000:.2f} ms max {self.max_jitter * 1000:.2f} ms, "
+                f"cost mean {self.total_cost / self.ticks * 1000:.3f} ms max {self.max_cost * 1000:.3f} ms")
+
+class FrameStats:
     def __init__(self):
         """
-        Constructor for Display_Clock class
+        Counts the frames of the sweeping clock, the frames it missed and the fps it got
         """
-        self.window = tk.Tk() # Create a window
+        self.frames = 0
+        self.dropped = 0
+        self.total_cost = 0.0
+        self.window_start = time.monotonic()
+        self.window_frames = 0
+        self.fps = 0.0
+
+    def record(self, cost, dropped):
+        """
+        Records one frame that took cost seconds, after dropped frames that never ran.
+        Returns True when a new fps value was measured.
+        """
+        self.frames += 1
+        self.window_frames += 1
+        self.dropped += dropped
+        self.total_cost += cost
+        elapsed = time.monotonic() - self.window_start
+        if elapsed >= 1:
+            self.fps = self.window_frames / elapsed
+            self.window_frames = 0
+            self.window_start += elapsed
+            return True
+        return False
+
+    def summary(self):
+        """Returns the statistics as a str"""
+        if self.frames == 0:
+            return "No frames"
+        return (f"{self.frames} frames, {self.dropped} dropped, {self.fps:.1f} fps, "
+                f"cost mean {self.total_cost / self.frames * 1000:.3f} ms")
+
+class Display_Clock:
+    def __init__(self, sweep=False, fps=60, backend=None):
+        """
+        Constructor for Display_Clock class.
+        With sweep the hands move smoothly at up to fps frames per second.
+        backend draws the window, by default with tkinter.
+        """
+        self.tk = backend or backends.TkBackend()
+        self.window = self.tk.Tk() # Create a window
         self.window.title("Clock") # Set a title
         self.canvas_width = 200
         self.frame_height = 200
@@ -24,17 +101,35 @@ class Display_Clock:
         self.radius = self.radius_percentage * 0.5 * self.canvas_width
         self.cur_angle = math.radians(360)
         self.counter_second, self.counter_minute, self.counter_hour = 0,0,0
+        self.TICK_MARGIN = 0.002 # seconds after the boundary the tick is scheduled, so it never runs early
+        self.tick_job = None
+        self.next_tick = time.time()
+        self.stats = TickStats()
+
+        #Smooth sweep mode
+        self.sweep = sweep
+        self.frame_period = 1 / fps
+        self.frame_stats = FrameStats()
+        self.next_frame = time.monotonic()
+        self.ANCHOR_SECONDS = 60 # how often the monotonic clock is anchored to wall time again
+        self.anchor_wall_ns = 0
+        self.anchor_mono_ns = 0
+        self.utc_offset = 0
+        self.TABLE_SIZE = 3600 # positions of a hand around the face, 0.1 degrees each
+        self.hand_positions = {}
+        self.shown_positions = {}
+        self.shown_second = None
         
         
         #Create Canvas
-        self.canvas = tk.Canvas(self.window, 
+        self.canvas = self.tk.Canvas(self.window, 
                 width = self.canvas_width,
                 height = self.canvas_height,
                 bg = 'white') 
         self.canvas.grid(row = 1, column = 1)
         
         #Create buttons and place them in a frame
-        self.button_frame= tk.Frame(self.window, width=self.canvas_width, height = self.frame_height)
+        self.button_frame= self.tk.Frame(self.window, width=self.canvas_width, height = self.frame_height)
         self.button_frame.grid(row=2, column=1, sticky='W')
         
         #Clock Circle
@@ -47,72 +142,161 @@ class Display_Clock:
         self.hours_text = self.canvas.create_text(self.canvas_width // 2, self.canvas_height // 2 - self.radius + 6, text = 12, fill = "black")
         
         #
-        self.start_button = tk.Button(self.button_frame, bg = 'white', command = self.start,
+        self.start_button = self.tk.Button(self.button_frame, bg = 'white', command = self.start,
                                         text = "Stop", width=self.button_width)
         self.start_button.grid(row = 1, column = 1, padx = (30,2),pady=5)
 
-        self.quit_button = tk.Button(self.button_frame, bg = 'white', command = self.quit,
+        self.quit_button = self.tk.Button(self.button_frame, bg = 'white', command = self.quit,
                                         text = "Quit", width=self.button_width)
         self.quit_button.grid(row = 1, column = 2, padx =(2,30), pady=5)
 
         #Display Timer
         self.display_timer = self.canvas.create_text(self.canvas_width // 2, self.canvas_height // 2 + self.radius + 7, text = time.strftime("%H:%M:%S"))
-        self.time_display()
+
+        #Hands are created once and moved every tick
+        center_x, center_y = self.canvas_width // 2, self.canvas_height // 2
+        self.second_hand = self.canvas.create_line(center_x, center_y, center_x, center_y, fill = "red", tag="hands")
+        self.minute_hand = self.canvas.create_line(center_x, center_y, center_x, center_y, fill = "blue", tag="hands")
+        self.hour_hand = self.canvas.create_line(center_x, center_y, center_x, center_y, fill = "green", tag="hands")
+        if self.sweep:
+            self.build_tables()
+            self.anchor()
+            self.sweep_display()
+        else:
+            self.time_display()
  
         self.window.mainloop()
 
     def time_display(self):
         """Displays the hands and the digital timer for the clock"""
+        started = time.time()
+        started_cost = time.perf_counter()
+        self.tick_job = None
+        current_time = datetime.datetime.fromtimestamp(started)
+
         #Get actual time in str
-        now = time.strftime("%H:%M:%S")
+        now = current_time.strftime("%H:%M:%S")
         self.canvas.itemconfig(self.display_timer, text=now)
        
         #Checks if the user did not hit stop button
         if self.start_button['text'] == 'Stop':
-            self.canvas.delete('hands')
-            current_time = datetime.datetime.now()
             
-            #Get angle Hours
-            self.cur_angle_hr = math.radians((((current_time.hour % 12) * 360) //12 + (current_time.minute * 360)//(12 * 60)-90))
-           
-            #Get angle Minutes
-            self.cur_angle_min = math.radians(((current_time.minute * 360) // 60)-90)
-           
-            #Get angle Seconds
-            self.cur_angle_sec = math.radians(((current_time.second * 360) // 60)-90)
+            #Get the end of every hand, the hour and minute hands move a little every second
+            seconds = clock_geometry.local_seconds(math.floor(started))
+            hour, minute, second = clock_geometry.hand_endpoints(seconds, self.canvas_width //2, self.canvas_height//2, self.radius)
            
             #Second Hand
-            self.x_cord_second = ((self.canvas_width //2) + (self.radius * 0.8) * math.cos(self.cur_angle_sec))
-            self.y_cord_second = ((self.canvas_height//2) + (self.radius * 0.8) * math.sin(self.cur_angle_sec))
-            self.second_hand = self.canvas.create_line(self.canvas_width //2,self.canvas_height//2, self.x_cord_second, self.y_cord_second,fill = "red", tag="hands")
+            self.x_cord_second, self.y_cord_second = second
+            self.canvas.coords(self.second_hand, self.canvas_width //2,self.canvas_height//2, self.x_cord_second, self.y_cord_second)
 
             #Minute Hand
-            self.x_cord_minute = ((self.canvas_width //2) + (self.radius * 0.65) * math.cos(self.cur_angle_min))
-            self.y_cord_minute = ((self.canvas_height//2) + (self.radius * 0.65) * math.sin(self.cur_angle_min))
-            self.minute_hand = self.canvas.create_line(self.canvas_width //2,self.canvas_height//2, self.x_cord_minute, self.y_cord_minute,fill = "blue",tag="hands")
+            self.x_cord_minute, self.y_cord_minute = minute
+            self.canvas.coords(self.minute_hand, self.canvas_width //2,self.canvas_height//2, self.x_cord_minute, self.y_cord_minute)
 
 
             #Hour Hand
-            self.x_cord_hour = ((self.canvas_width //2) + (self.radius * 0.5) * math.cos(self.cur_angle_hr))
-            self.y_cord_hour = ((self.canvas_height//2) + (self.radius * 0.5) * math.sin(self.cur_angle_hr))
-            self.hour_hand = self.canvas.create_line(self.canvas_width //2,self.canvas_height//2, self.x_cord_hour, self.y_cord_hour,fill = "green",tag="hands")
-            self.window.after(1000, self.time_display)
+            self.x_cord_hour, self.y_cord_hour = hour
+            self.canvas.coords(self.hour_hand, self.canvas_width //2,self.canvas_height//2, self.x_cord_hour, self.y_cord_hour)
+
+            self.stats.record(self.next_tick, started, started + time.perf_counter() - started_cost)
+            self.schedule_tick()
         else:
             pass
+
+    def schedule_tick(self):
+        """Schedules the next tick right after the next wall clock second"""
+        self.next_tick = math.floor(time.time()) + 1
+        delay = self.next_tick + self.TICK_MARGIN - time.time()
+        self.tick_job = self.window.after(max(0, math.ceil(delay * 1000)), self.time_display)
         
     
     
+    def build_tables(self):
+        """Precomputes the end point of every hand at every position around the face"""
+        center_x, center_y = self.canvas_width // 2, self.canvas_height // 2
+        cosines = [math.cos(2 * math.pi * i / self.TABLE_SIZE - math.pi / 2) for i in range(self.TABLE_SIZE)]
+        sines = [math.sin(2 * math.pi * i / self.TABLE_SIZE - math.pi / 2) for i in range(self.TABLE_SIZE)]
+        for hand, length in zip((self.hour_hand, self.minute_hand, self.second_hand), clock_geometry.HAND_LENGTHS):
+            self.hand_positions[hand] = [(center_x, center_y, center_x + self.radius * length * cos, center_y + self.radius * length * sin)
+                                         for cos, sin in zip(cosines, sines)]
+
+    def anchor(self):
+        """Ties the monotonic clock to the wall clock and the local time zone"""
+        self.anchor_wall_ns = time.time_ns()
+        self.anchor_mono_ns = time.monotonic_ns()
+        self.utc_offset = time.localtime(self.anchor_wall_ns // 10**9).tm_gmtoff
+
+    def sweep_display(self):
+        """Moves the hands to the current fraction of a second, one frame of the sweeping clock"""
+        started = time.perf_counter()
+        self.tick_job = None
+        if self.start_button['text'] != 'Stop':
+            return
+
+        mono_ns = time.monotonic_ns()
+        if mono_ns - self.anchor_mono_ns > self.ANCHOR_SECONDS * 10**9:
+            self.anchor()
+            mono_ns = time.monotonic_ns()
+        wall_ns = self.anchor_wall_ns + mono_ns - self.anchor_mono_ns
+        local_seconds = wall_ns / 10**9 + self.utc_offset
+
+        #the digital timer only changes once a second
+        second = int(local_seconds)
+        if second != self.shown_second:
+            self.shown_second = second
+            self.canvas.itemconfig(self.display_timer, text=time.strftime("%H:%M:%S", time.gmtime(second)))
+
+        #only the hands that moved to another position are updated
+        fractions = clock_geometry.hand_fractions(local_seconds)
+        for hand, fraction in zip((self.hour_hand, self.minute_hand, self.second_hand), fractions):
+            position = int(fraction * self.TABLE_SIZE) % self.TABLE_SIZE
+            if self.shown_positions.get(hand) != position:
+                self.shown_positions[hand] = position
+                self.canvas.coords(hand, *self.hand_positions[hand][position])
+
+        #frames are kept on a fixed grid, the ones that are already late are dropped
+        now = time.monotonic()
+        self.next_frame += self.frame_period
+        dropped = 0
+        if now > self.next_frame:
+            dropped = int((now - self.next_frame) / self.frame_period) + 1
+            self.next_frame += dropped * self.frame_period
+        if self.frame_stats.record(time.perf_counter() - started, dropped):
+            self.window.title(f"Clock {self.frame_stats.fps:.1f} fps, {self.frame_stats.dropped} dropped")
+        self.tick_job = self.window.after(max(1, round((self.next_frame - now) * 1000)), self.sweep_display)
+
     def start(self):
         """Changes the buttons text and callls the time display to stop"""
         if self.start_button['text'] == 'Stop':
             self.start_button['text'] = 'Start'
         else:
             self.start_button['text'] = 'Stop'
-            self.time_display()
+            #a tick scheduled before stopping would start a second chain of ticks
+            if self.tick_job is not None:
+                self.window.after_cancel(self.tick_job)
+            if self.sweep:
+                self.next_frame = time.monotonic()
+                self.sweep_display()
+            else:
+                self.next_tick = time.time()
+                self.stats.last_second = None # the stopped seconds are not skipped ticks
+                self.time_display()
     
     def quit(self): 
         """Exits the program"""
+        if self.sweep:
+            print(self.frame_stats.summary())
+        else:
+            print(self.stats.summary())
         self.window.destroy()
 
+def main(arguments=None, backend=None):
+    parser = argparse.ArgumentParser(description="Display a clock")
+    parser.add_argument('--sweep', action='store_true', help="move the hands smoothly")
+    parser.add_argument('--fps', type=int, default=60, help="most frames per second in sweep mode")
+    args = parser.parse_args(arguments)
+    Display_Clock(args.sweep, args.fps, backend)
+
+
 if __name__ == "__main__":
-    Display_Clock()
+    main()
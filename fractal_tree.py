@@ -4,14 +4,21 @@ Author: Eduardo Pérez
 Date:3/31/22
 Description: Displays fractal tree
 """
-import tkinter as tk
+import argparse
+import backends
 import math
+import time
+import numpy as np
+import lsystem
 class FractalTree:
-    def __init__(self):
-        """ Initialize the fractal object. """
+    def __init__(self, rule=None, backend=None):
+        """ Initialize the fractal object. rule is the LSystem the tree grows with,
+        by default two children turned by pi/5 and scaled by child_branch.
+        backend draws the window, by default with tkinter. """
 
         #instance variables
-        self.window = tk.Tk()
+        self.tk = backend or backends.TkBackend()
+        self.window = self.tk.Tk()
         self.canvas_width = 400
         self.canvas_height = 400
         self.button_Width = 14
@@ -20,63 +27,113 @@ class FractalTree:
         self.angle = math.pi/2
         self.x_1 = self.canvas_width//2
         self.y_1 = self.canvas_height - 20
+        self.rule = rule
+        if self.rule is None:
+            self.rule = lsystem.LSystem(scales=self.child_branch)
+        self.FRAME_BUDGET = 0.015 #seconds spent drawing before letting the window handle events
+        self.DRAW_CHUNK = 256 #lines drawn between checks of the frame budget
+        self.pending = np.empty((0,4)) #segments waiting to be drawn
+        self.pending_start = 0 #index of the first segment in pending that is not drawn
+        self.draw_job = None #id of the scheduled draw_step
 
 
     #make the canvas
-        self.canvas = tk.Canvas(self.window, 
+        self.canvas = self.tk.Canvas(self.window, 
                 width = self.canvas_width,
                 height = self.canvas_height,
                 bg = 'white')
         self.canvas.grid(row=1,column=1) 
 
         #Buttons created
-        self.button_Frame = tk.Frame(self.window,width=self.canvas_width,height=self.canvas_height)
+        self.button_Frame = self.tk.Frame(self.window,width=self.canvas_width,height=self.canvas_height)
         self.button_Frame.grid(row=2,column=1)
         
-        self.advance_button = tk.Button(self.button_Frame, bg = 'white', command = self.advance, text = 'Advance',width = self.button_Width)
+        self.advance_button = self.tk.Button(self.button_Frame, bg = 'white', command = self.advance, text = 'Advance',width = self.button_Width)
         self.advance_button.grid(row=2,column=1)
 
-        self.reset_button = tk.Button(self.button_Frame, bg = 'white', command = self.reset, text = 'Reset',width = self.button_Width)
+        self.reset_button = self.tk.Button(self.button_Frame, bg = 'white', command = self.reset, text = 'Reset',width = self.button_Width)
         self.reset_button.grid(row=2,column=2)
 
-        self.quit_button = tk.Button(self.button_Frame, bg = 'white', command = self.quit, text = 'Quit',width = self.button_Width)
+        self.quit_button = self.tk.Button(self.button_Frame, bg = 'white', command = self.quit, text = 'Quit',width = self.button_Width)
         self.quit_button.grid(row=2,column=3)
 
-        self.build_tree(self.level,self.x_1,self.y_1,self.angle, self.canvas_height//3)
+        #Shows how much of the level is drawn
+        self.progress = self.tk.StringVar()
+        self.progress_label = self.tk.Label(self.button_Frame, textvariable = self.progress)
+        self.progress_label.grid(row=3,column=1,columnspan=3)
+
+        self.build_level(self.level)
                         
         self.window.mainloop()
 
     def advance(self):
         """"Move forward on more level of recursion"""
         self.level = self.level + 1
-        self.build_tree(self.level,self.x_1,self.y_1,self.angle, self.canvas_height//3)
+        #only the new level is drawn, the old branches stay on the canvas
+        self.build_level(self.level)
    
     def reset(self):
         """Delte everything drawn"""
         self.level = 0
+        self.cancel_drawing()
+        self.pending = np.empty((0,4))
+        self.pending_start = 0
+        #the memoized subtrees of the deep levels are not needed any more
+        self.rule.clear()
         self.canvas.delete("all")
-        self.build_tree(self.level,self.x_1,self.y_1,self.angle, self.canvas_height//3)
+        self.build_level(self.level)
    
     def quit(self):
         """Terminate program"""
+        self.cancel_drawing()
         self.window.destroy()
 
+    def build_level(self,level):
+        """input: self, int: level of the tree
+        queue the layer of lines of that level"""
+        segments = self.rule.level(level,self.x_1,self.y_1,self.angle,self.canvas_height//3)
+        #a drawing in progress is cancelled and its remaining lines go first in the new one
+        self.cancel_drawing()
+        self.pending = np.concatenate((self.pending[self.pending_start:], segments))
+        self.pending_start = 0
+        self.draw_step()
+
+    def draw_step(self):
+        """Draw pending lines until the frame budget runs out and schedule the rest"""
+        deadline = time.perf_counter() + self.FRAME_BUDGET
+        while self.pending_start < len(self.pending) and time.perf_counter() < deadline:
+            self.draw_segments(self.pending[self.pending_start:self.pending_start + self.DRAW_CHUNK])
+            self.pending_start = min(self.pending_start + self.DRAW_CHUNK, len(self.pending))
+        self.progress.set(f"Level {self.level}: {self.pending_start} of {len(self.pending)} lines drawn")
+
+        if self.pending_start < len(self.pending):
+            self.draw_job = self.window.after(1, self.draw_step)
+        else:
+            self.draw_job = None
+
+    def cancel_drawing(self):
+        """Stop the scheduled draw_step if there is one"""
+        if self.draw_job is not None:
+            self.window.after_cancel(self.draw_job)
+            self.draw_job = None
+
     def build_tree(self,level,x,y,angle,len):
         """input: self, int: level of recursion, double: x index of base branch, double: y index of base branch, double: angle radius, double: length of branch
-        create a layer of lines in the tree """
-        #base case
-        if level < 0:
-            return
+        create every layer of lines in the tree up to level """
+        self.draw_segments(self.rule.segments(level,x,y,angle,len))
 
-        #recursive case
-        else:
-            new_x_2 =  x + int(math.cos(angle)*len) 
-            new_y_2 = y - int(math.sin(angle)*len)
-            self.canvas.create_line(x,y,new_x_2,new_y_2)
-        
-        #next fractals
-            self.build_tree(level - 1, new_x_2,new_y_2,angle+math.pi/5,len*self.child_branch)
-            self.build_tree(level - 1, new_x_2,new_y_2,angle-math.pi/5,len*self.child_branch)
+    def draw_segments(self,segments):
+        """input: self, array: (n, 4) segments
+        create a line in the canvas for every segment"""
+        for x_1,y_1,x_2,y_2 in segments.tolist():
+            self.canvas.create_line(x_1,y_1,x_2,y_2)
     
+def main(arguments=None, backend=None):
+    parser = argparse.ArgumentParser(description="Display a fractal tree")
+    lsystem.add_arguments(parser)
+    args = parser.parse_args(arguments)
+    FractalTree(lsystem.from_arguments(parser, args), backend)
+
+
 if __name__ == "__main__":
-    FractalTree()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""
+File: launcher.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Starts one of the apps, importing only what that app needs,
+and can report how long it takes to start.
+Usage: python -m launcher [--profile-startup] [--headless] wordy|tree|clock|world|viewer [app options]
+"""
+import argparse
+import importlib
+import sys
+import time
+
+# app name -> module, the module is only imported when the app is chosen,
+# its main function reads the options of the app and starts it
+APPS = {
+    'wordy': 'wordle',
+    'tree': 'fractal_tree',
+    'clock': 'display_clock',
+    'world': 'world_clock',
+    'viewer': 'tree_viewer',
+}
+
+# modules that are slow to import, the report says if the app loaded them
+HEAVY_MODULES = ('numpy', 'tkinter', 'zoneinfo', 'multiprocessing')
+
+
+def profile_backend(backend, timings, start, show_report, exit_after_paint):
+    """
+    Changes backend.Tk so the window it makes records the time until mainloop is called
+    (the widgets are built) and until the first frame is drawn, then prints the report.
+    """
+    make_window = backend.Tk
+
+    def Tk():
+        window = make_window()
+        real_mainloop = window.mainloop
+
+        def mainloop(*args):
+            timings['construct'] = time.perf_counter() - start
+            #update draws everything that is waiting, which is the first frame
+            window.update()
+            timings['first paint'] = time.perf_counter() - start
+            if show_report:
+                report(timings, backend)
+            if exit_after_paint:
+                window.destroy()
+            else:
+                real_mainloop(*args)
+
+        window.mainloop = mainloop
+        return window
+
+    backend.Tk = Tk
+
+
+def report(timings, backend):
+    """Prints the startup times"""
+    print(f"import:      {timings['import'] * 1000:8.1f} ms")
+    print(f"construct:   {(timings['construct'] - timings['import']) * 1000:8.1f} ms")
+    print(f"first paint: {(timings['first paint'] - timings['construct']) * 1000:8.1f} ms")
+    print(f"total:       {timings['first paint'] * 1000:8.1f} ms")
+    print("loaded: " + ', '.join(f"{name} {'yes' if name in sys.modules else 'no'}" for name in HEAVY_MODULES))
+    if hasattr(backend, 'draw_calls'):
+        print(f"draw calls:  {backend.draw_calls():8d}")
+        print("by widget: " + ', '.join(f"{kind} {count}" for kind, count in sorted(backend.draw_calls_by_kind().items())))
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(prog='python -m launcher', description="Start one of the apps",
+                                     epilog="the launcher options go before the app, everything after the app "
+                                            "is given to it, like --sweep for clock or --help for its own options")
+    parser.add_argument('app', choices=sorted(APPS))
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="print import, construction and first paint times")
+    parser.add_argument('--exit-after-paint', action='store_true',
+                        help="close the app after the first frame, to time cold starts from a script")
+    parser.add_argument('--headless', action='store_true',
+                        help="use the recording backend instead of a window")
+    #the launcher stops reading at the app name, the rest is checked by the parser of the app
+    parser.add_argument('app_arguments', nargs=argparse.REMAINDER, help="options of the app")
+    args = parser.parse_args(arguments)
+
+    start = time.perf_counter()
+    timings = {}
+    app = importlib.import_module(APPS[args.app])
+    backends = importlib.import_module('backends')
+    backend = backends.RecordingBackend() if args.headless else backends.TkBackend()
+    timings['import'] = time.perf_counter() - start
+
+    if args.profile_startup or args.exit_after_paint:
+        profile_backend(backend, timings, start, args.profile_startup, args.exit_after_paint)
+    app.main(args.app_arguments, backend)
+
+
+if __name__ == "__main__":
+    main()
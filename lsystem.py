@@ -0,0 +1,157 @@
+"""
+File: lsystem.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Branching L-system that builds fractal trees from memoized subtrees.
+It is the only place the tree geometry is made, the app, the exporter, the viewer
+and the parallel generator all grow their trees with it.
+"""
+import numpy as np
+import tree_geometry
+
+class LSystem:
+    def __init__(self, angles=(tree_geometry.BRANCH_ANGLE, -tree_geometry.BRANCH_ANGLE),
+                 scales=tree_geometry.CHILD_BRANCH, angle_jitter=0.0, scale_jitter=0.0, seed=None, variants=4):
+        """input: list: angle of every child branch, double or list: scale of every child branch,
+        double: largest random change of an angle, double: largest random change of a scale as a fraction,
+        int: seed, int: different random subtrees kept for every level
+        Initialize the rule every branch follows to grow its children."""
+        self.angles = np.asarray(angles, dtype=float).ravel()
+        scales = np.asarray(scales, dtype=float).ravel()
+        if len(self.angles) == 0:
+            raise ValueError("a branch needs at least one child angle")
+        if len(scales) not in (1, len(self.angles)):
+            raise ValueError(f"{len(scales)} scales given for {len(self.angles)} angles, give one scale or one per angle")
+        self.scales = np.broadcast_to(scales, self.angles.shape).copy()
+        self.angle_jitter = angle_jitter
+        self.scale_jitter = scale_jitter
+        self.randomized = angle_jitter != 0 or scale_jitter != 0
+        if seed is None:
+            seed = np.random.SeedSequence().entropy
+        self.seed = seed
+        #without randomness every branch of a level grows the same way
+        self.variants = variants if self.randomized else 1
+
+        #(level, variant) -> child variants and the complex transform of every child
+        self.children = {}
+        #(level, variant, depth) -> start and end points of the segments depth levels below
+        #a branch of that level and variant, in its own coordinates
+        self.rows = {}
+
+    def __getstate__(self):
+        """the memoized subtrees are not sent to other processes, they can be big"""
+        state = self.__dict__.copy()
+        state['rows'] = {}
+        return state
+
+    def __len__(self):
+        """return the number of branches a branch grows"""
+        return len(self.angles)
+
+    def segment_count(self, depth):
+        """return the number of segments in a tree with levels 0 to depth"""
+        branches = len(self)
+        if branches == 1:
+            return depth + 1
+        return (branches**(depth + 1) - 1)//(branches - 1)
+
+    def clear(self):
+        """Forget every memoized subtree"""
+        self.children.clear()
+        self.rows.clear()
+
+    def grow(self, level, variant):
+        """return the variant and transform of every child of a branch of that level and variant"""
+        key = (level, variant) if self.randomized else (0, 0)
+        if key not in self.children:
+            angles = self.angles
+            scales = self.scales
+            child_variants = np.zeros(len(self), dtype=np.int64)
+            if self.randomized:
+                #one generator per level and variant so the tree does not depend on the order it is built
+                rng = np.random.default_rng([self.seed, level, variant])
+                angles = angles + rng.uniform(-self.angle_jitter, self.angle_jitter, len(self))
+                scales = scales*(1 + rng.uniform(-self.scale_jitter, self.scale_jitter, len(self)))
+                child_variants = rng.integers(self.variants, size=len(self))
+            #canvas y goes down, so turning left is a negative angle in complex canvas coordinates
+            self.children[key] = (child_variants, scales*np.exp(-1j*angles))
+        return self.children[key]
+
+    def local_level(self, level, variant, depth):
+        """return a (n, 2) complex array with the segments depth levels below a branch that
+        starts at 0 and ends at 1, memoized so every subtree is only built once"""
+        key = (level, variant, depth) if self.randomized else (0, 0, depth)
+        if key not in self.rows:
+            if depth == 0:
+                rows = np.array([[0, 1]], dtype=complex)
+            else:
+                #every child starts where this branch ends, turned and scaled
+                child_variants, transforms = self.grow(level, variant)
+                rows = np.concatenate([1 + transform*self.local_level(level + 1, child, depth - 1)
+                                       for child, transform in zip(child_variants.tolist(), transforms)])
+            self.rows[key] = rows
+        return self.rows[key]
+
+    def place(self, rows, x, y, angle, length):
+        """input: array: complex segments, double: x, double: y, double: angle, double: length
+        return the (n, 4) canvas segments of rows grown from a trunk at x, y"""
+        points = (x + 1j*y) + length*np.exp(-1j*angle)*rows
+        return np.column_stack((points[:, 0].real, points[:, 0].imag, points[:, 1].real, points[:, 1].imag))
+
+    def level(self, level, x, y, angle, length):
+        """return the (n, 4) segments of one level of the tree grown from a trunk at x, y"""
+        return self.place(self.local_level(0, 0, level), x, y, angle, length)
+
+    def segments(self, depth, x, y, angle, length):
+        """return the (N, 4) segments of every level from 0 to depth"""
+        return np.concatenate([self.level(level, x, y, angle, length) for level in range(depth + 1)])
+
+    def trunk(self, x, y, angle, length):
+        """input: double: x of the base, double: y of the base, double: angle, double: length
+        return the frontier (variant, start and complex vector arrays) holding only the trunk"""
+        return (np.zeros(1, dtype=np.int64), np.array([x + 1j*y]), np.array([length*np.exp(-1j*angle)]))
+
+    def next_level(self, frontier, level):
+        """input: tuple: frontier of branches of that level, int: level
+        return an (n, 4) array with the segments of the branches and the frontier of their children,
+        without memoizing anything so memory only grows with the frontier"""
+        variants, starts, vectors = frontier
+        ends = starts + vectors
+        segments = np.column_stack((starts.real, starts.imag, ends.real, ends.imag))
+        grown = [self.grow(level, variant) for variant in range(self.variants)]
+        child_variants = np.stack([children for children, transforms in grown])[variants]
+        transforms = np.stack([transforms for children, transforms in grown])[variants]
+        next_frontier = (child_variants.ravel(), np.repeat(ends, len(self)), (vectors[:, np.newaxis]*transforms).ravel())
+        return segments, next_frontier
+
+    def iter_chunks(self, depth, x, y, angle, length, chunk_size=65536):
+        """yield (n, 4) segment arrays with at most chunk_size segments that together make the
+        whole tree, walking big levels one piece at a time so memory does not grow with depth"""
+        pending = [(self.trunk(x, y, angle, length), 0)]
+        while pending:
+            frontier, level = pending.pop()
+            segments, frontier = self.next_level(frontier, level)
+            yield segments
+            if level < depth:
+                #split the next level into pieces that each fit in one chunk
+                for start in reversed(range(0, len(frontier[0]), chunk_size)):
+                    pending.append((tuple(part[start:start + chunk_size] for part in frontier), level + 1))
+
+
+def add_arguments(parser):
+    """Adds the options that choose the rule to an argparse parser"""
+    parser.add_argument('--angles', type=float, nargs='+', default=[tree_geometry.BRANCH_ANGLE, -tree_geometry.BRANCH_ANGLE],
+                        help="angle of every child branch in radians")
+    parser.add_argument('--scales', type=float, nargs='+', default=[tree_geometry.CHILD_BRANCH],
+                        help="scale of every child branch, or one scale for all of them")
+    parser.add_argument('--angle-jitter', type=float, default=0.0)
+    parser.add_argument('--scale-jitter', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=None)
+
+
+def from_arguments(parser, args):
+    """return the LSystem chosen by the options of add_arguments, a wrong rule is a parser error"""
+    try:
+        return LSystem(args.angles, args.scales, args.angle_jitter, args.scale_jitter, args.seed)
+    except ValueError as error:
+        parser.error(str(error))
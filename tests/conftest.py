@@ -0,0 +1,10 @@
+"""
+File: conftest.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Lets the tests import the apps from the folder above without installing anything
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
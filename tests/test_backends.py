@@ -0,0 +1,56 @@
+"""
+File: test_backends.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Checks that every app runs without a window and that its drawing is counted
+"""
+import contextlib
+import io
+import backends
+import display_clock
+import fractal_tree
+import wordle
+
+
+def make_wordy(backend):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return wordle.Wordy(backend=backend)
+
+
+def test_every_app_counts_draw_calls():
+    for make in (make_wordy, lambda backend: fractal_tree.FractalTree(backend=backend),
+                 lambda backend: display_clock.Display_Clock(backend=backend)):
+        backend = backends.RecordingBackend()
+        make(backend)
+        assert backend.draw_calls() > 0
+        assert backend.draw_calls() == sum(backend.draw_calls_by_kind().values())
+
+
+def test_wordy_draws_with_widgets():
+    backend = backends.RecordingBackend()
+    make_wordy(backend)
+    kinds = backend.draw_calls_by_kind()
+    assert kinds['Button'] > 0 and kinds['Frame'] > 0
+    assert backend.draw_calls('Canvas') == 0
+
+
+def test_scheduled_jobs_can_be_cancelled():
+    backend = backends.RecordingBackend()
+    window = backend.Tk()
+    ran = []
+    job = window.after(10, ran.append, 1)
+    window.after(20, ran.append, 2)
+    window.after_cancel(job)
+    assert backend.run_jobs() == 1
+    assert ran == [2]
+
+
+def test_null_backend_keeps_no_items():
+    backend = backends.NullBackend()
+    tree = fractal_tree.FractalTree(backend=backend)
+    tree.build_tree(8, tree.x_1, tree.y_1, tree.angle, tree.canvas_height//3)
+    assert tree.canvas.find_all() == ()
+    assert backend.operations == []
+    #the widgets still keep their options, the apps read them back
+    clock = display_clock.Display_Clock(backend=backends.NullBackend())
+    assert clock.start_button['text'] == 'Stop'
@@ -0,0 +1,56 @@
+"""
+File: test_benchmarks.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Checks the benchmark gate and, with RUN_BENCHMARKS=1, runs it against the committed baseline
+"""
+import json
+import os
+import pytest
+import benchmarks
+
+
+def result(seconds, noise=0.0, params=None):
+    return {'seconds': seconds, 'noise': noise, 'params': params or {}}
+
+
+def test_slower_than_allowed_fails():
+    baseline = {'a': result(1.0, 0.05), 'b': result(1.0, 0.05)}
+    assert benchmarks.compare({'a': result(1.2), 'b': result(1.5)}, baseline, 0.25, verbose=False) == ['b']
+
+
+def test_noise_is_capped():
+    #a very noisy baseline still fails a benchmark that got twice as slow
+    assert benchmarks.compare({'a': result(2.0)}, {'a': result(1.0, 5.0)}, 0.25, verbose=False) == ['a']
+
+
+def test_one_slow_run_does_not_change_the_noise():
+    seconds, noise = benchmarks.summary([1.0]*10 + [3.0])
+    assert seconds == 1.0 and noise == 0.0
+
+
+def test_other_parameters_need_a_new_baseline():
+    baseline = {'a': result(1.0, params={'words': 'long_wordlist.txt'})}
+    assert benchmarks.compare({'a': result(1.0, params={'words': '2000 synthetic words'}),
+                               'b': result(1.0)}, baseline, 0.25, verbose=False) == ['a', 'b']
+
+
+def test_other_machine_is_skipped(tmp_path, capsys):
+    path = tmp_path / 'baseline.json'
+    path.write_text(json.dumps({'machine': {'machine': 'other'}, 'results': {}}))
+    assert benchmarks.main(['--baseline', str(path)]) == 0
+    assert 'Skipped' in capsys.readouterr().out
+
+
+def test_missing_baseline_fails(tmp_path):
+    assert benchmarks.main(['--baseline', str(tmp_path / 'baseline.json')]) == 1
+
+
+def test_committed_baseline_has_every_benchmark():
+    baseline = benchmarks.load_baseline(benchmarks.BASELINE_FILE)
+    assert sorted(baseline['results']) == sorted(benchmarks.BENCHMARKS)
+
+
+@pytest.mark.skipif(os.environ.get('RUN_BENCHMARKS') != '1', reason="takes minutes, set RUN_BENCHMARKS=1")
+def test_no_regressions():
+    assert benchmarks.main([]) == 0
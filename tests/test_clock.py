@@ -0,0 +1,64 @@
+"""
+File: test_clock.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Checks the clock model at known times and the clocks drawn without a window
+"""
+import math
+import numpy as np
+import pytest
+import backends
+import clock_geometry
+import display_clock
+import world_clock
+
+
+@pytest.mark.parametrize('seconds, hour, minute, second', [
+    (0, 0, 0, 0),                     # midnight, every hand at 12
+    (3*3600, 90, 0, 0),               # 3:00, hour hand at 3
+    (6*3600 + 30*60, 195, 180, 0),    # 6:30, the hour hand is half way to 7
+    (9*3600 + 15*60 + 45, 277.875, 94.5, 270),
+    (12*3600 + 20, 20/120, 2, 120),   # noon is the same as midnight for the hour hand
+])
+def test_hand_angles(seconds, hour, minute, second):
+    #degrees clockwise from 12 o'clock, 12 o'clock is -pi/2 in canvas coordinates
+    angles = clock_geometry.hand_angles(seconds)
+    for angle, degrees in zip(angles, (hour, minute, second)):
+        assert math.isclose((math.degrees(angle) + 90) % 360, degrees % 360, abs_tol=1e-9)
+
+
+def test_hand_endpoints_at_three():
+    hour, minute, second = clock_geometry.hand_endpoints(3*3600, 100, 100, 80)
+    assert hour == pytest.approx((100 + 80*clock_geometry.HAND_LENGTHS[0], 100))
+    assert minute == pytest.approx((100, 100 - 80*clock_geometry.HAND_LENGTHS[1]))
+    assert second == pytest.approx((100, 100 - 80*clock_geometry.HAND_LENGTHS[2]))
+
+
+def test_array_matches_scalar():
+    seconds = np.array([0, 4000.5, 43199, 86400*3 + 12345])
+    ends = clock_geometry.hand_endpoints_array(seconds, 100, 50, 80)
+    assert ends.shape == (4, 3, 2)
+    for index, time in enumerate(seconds.tolist()):
+        assert ends[index] == pytest.approx(np.array(clock_geometry.hand_endpoints(time, 100, 50, 80)))
+
+
+def test_clock_hands_move_with_the_model():
+    backend = backends.RecordingBackend()
+    clock = display_clock.Display_Clock(backend=backend)
+    assert backend.draw_calls('Canvas') > 0
+    x, y = clock.canvas.coords(clock.second_hand)[2:]
+    assert (x, y) == pytest.approx((clock.x_cord_second, clock.y_cord_second))
+
+
+def test_world_clock_faces_follow_their_zone():
+    backend = backends.RecordingBackend()
+    clock = world_clock.WorldClock(['UTC', 'Asia/Kolkata'], backend=backend)
+    utc, kolkata = clock.offsets.tolist()
+    assert (utc, kolkata) == (0, 5.5*3600)
+    #the minute hands are half an hour apart
+    minute_angles = []
+    for index in range(2):
+        center_x, center_y, end_x, end_y = clock.canvas.coords(clock.hands[index][1])
+        minute_angles.append(math.atan2(end_y - center_y, end_x - center_x))
+    difference = (minute_angles[1] - minute_angles[0]) % (2*math.pi)
+    assert math.isclose(difference, math.pi, abs_tol=0.01)
@@ -0,0 +1,42 @@
+"""
+File: test_launcher.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Checks that the launcher gives the options after the app name to the app
+"""
+import contextlib
+import io
+import pytest
+import launcher
+
+
+def run(arguments):
+    """return what the launcher printed"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        launcher.main(arguments)
+    return output.getvalue()
+
+
+def test_app_help_is_the_help_of_the_app(capsys):
+    with pytest.raises(SystemExit) as exit:
+        launcher.main(['tree', '--help'])
+    assert exit.value.code == 0
+    assert '--angles' in capsys.readouterr().out
+
+
+def test_app_options_reach_the_app():
+    output = run(['--headless', '--profile-startup', '--exit-after-paint', 'clock', '--sweep', '--fps', '30'])
+    assert 'draw calls' in output
+
+
+def test_unknown_app_option_is_an_error():
+    with pytest.raises(SystemExit) as exit:
+        run(['--headless', '--exit-after-paint', 'wordy', '--bogus'])
+    assert exit.value.code == 2
+
+
+def test_wrong_rule_is_an_error():
+    with pytest.raises(SystemExit) as exit:
+        run(['--headless', '--exit-after-paint', 'tree', '--angles', '1', '2', '3', '--scales', '0.5', '0.4'])
+    assert exit.value.code == 2
@@ -0,0 +1,119 @@
+"""
+File: test_tree.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Checks that every way of growing the fractal tree gives the same branches
+"""
+import math
+import numpy as np
+import pytest
+import backends
+import fractal_tree
+import lsystem
+import tree_export
+import tree_geometry
+import tree_parallel
+
+X, Y, ANGLE, LENGTH = 200, 380, math.pi/2, 400//3
+
+RULES = {
+    'default': lambda: lsystem.LSystem(),
+    'three branches': lambda: lsystem.LSystem([0.5, 0, -0.4], [0.5, 0.6, 0.4]),
+    'random': lambda: lsystem.LSystem([0.5, 0, -0.4], 0.5, angle_jitter=0.2, scale_jitter=0.1, seed=7),
+}
+
+
+def recursive_tree(level, x, y, angle, length, segments):
+    """the tree the way the first FractalTree.build_tree drew it, one branch at a time"""
+    x_2 = x + math.cos(angle)*length
+    y_2 = y - math.sin(angle)*length
+    segments.append((x, y, x_2, y_2))
+    if level > 0:
+        recursive_tree(level - 1, x_2, y_2, angle + tree_geometry.BRANCH_ANGLE, length*tree_geometry.CHILD_BRANCH, segments)
+        recursive_tree(level - 1, x_2, y_2, angle - tree_geometry.BRANCH_ANGLE, length*tree_geometry.CHILD_BRANCH, segments)
+    return segments
+
+
+def same_segments(a, b):
+    """True when a and b have the same segments in any order"""
+    if a.shape != b.shape:
+        return False
+    order_a = np.lexsort(np.round(a, 6).T)
+    order_b = np.lexsort(np.round(b, 6).T)
+    return np.allclose(a[order_a], b[order_b], atol=1e-9)
+
+
+def test_default_rule_is_the_recursive_tree():
+    expected = np.array(recursive_tree(9, X, Y, ANGLE, LENGTH, []))
+    assert same_segments(lsystem.LSystem().segments(9, X, Y, ANGLE, LENGTH), expected)
+
+
+@pytest.mark.parametrize('name', RULES)
+def test_chunks_and_parallel_match_segments(name):
+    rule = RULES[name]()
+    segments = rule.segments(7, X, Y, ANGLE, LENGTH)
+    assert len(segments) == rule.segment_count(7)
+    chunks = list(RULES[name]().iter_chunks(7, X, Y, ANGLE, LENGTH, chunk_size=50))
+    assert max(len(chunk) for chunk in chunks) <= 50*len(rule)
+    assert same_segments(np.concatenate(chunks), segments)
+    parallel = tree_parallel.parallel_tree_segments(7, X, Y, ANGLE, LENGTH, processes=2, rule=RULES[name]())
+    assert same_segments(parallel, segments)
+
+
+def test_parallel_in_one_process():
+    rule = lsystem.LSystem()
+    parallel = tree_parallel.parallel_tree_segments(10, X, Y, ANGLE, LENGTH, processes=1, split_level=3, rule=rule)
+    assert same_segments(parallel, rule.segments(10, X, Y, ANGLE, LENGTH))
+
+
+def test_same_seed_same_tree():
+    first = RULES['random']().segments(6, X, Y, ANGLE, LENGTH)
+    assert np.array_equal(first, RULES['random']().segments(6, X, Y, ANGLE, LENGTH))
+
+
+def test_wrong_number_of_scales():
+    with pytest.raises(ValueError):
+        lsystem.LSystem([1, 2, 3], [0.5, 0.4])
+
+
+def test_export_draws_the_app_tree():
+    #the exporter places the tree like FractalTree on a canvas of the same size
+    exported = np.concatenate(list(tree_export.tree_chunks(8, chunk_size=64)))
+    tree = fractal_tree.FractalTree(backend=backends.NullBackend())
+    assert same_segments(exported, tree.rule.segments(8, tree.x_1, tree.y_1, tree.angle, tree.canvas_height//3))
+
+
+def test_segment_grid_query_matches_brute_force():
+    segments = lsystem.LSystem().segments(11, X, Y, ANGLE, LENGTH)
+    grid = tree_geometry.SegmentGrid(segments, cells=16)
+    assert len(grid) == len(segments)
+    lengths = np.hypot(segments[:, 2] - segments[:, 0], segments[:, 3] - segments[:, 1])
+    for x_min, y_min, x_max, y_max, min_length in [(0, 0, 400, 400, 0), (150, 100, 220, 180, 0),
+                                                   (150, 100, 220, 180, 2), (-50, -50, -10, -10, 0)]:
+        inside = ((np.minimum(segments[:, 0], segments[:, 2]) <= x_max) &
+                  (np.maximum(segments[:, 0], segments[:, 2]) >= x_min) &
+                  (np.minimum(segments[:, 1], segments[:, 3]) <= y_max) &
+                  (np.maximum(segments[:, 1], segments[:, 3]) >= y_min) & (lengths >= min_length))
+        assert same_segments(grid.query(x_min, y_min, x_max, y_max, min_length), segments[inside])
+
+
+def test_canvas_has_a_line_for_every_segment():
+    backend = backends.RecordingBackend()
+    tree = fractal_tree.FractalTree(backend=backend)
+    for level in range(8):
+        tree.advance()
+    backend.run_jobs()
+    assert tree.draw_job is None
+    assert len(tree.canvas.find_all()) == tree.rule.segment_count(8)
+    assert backend.counts['Canvas.create_line'] == tree.rule.segment_count(8)
+
+
+def test_reset_forgets_the_tree():
+    backend = backends.RecordingBackend()
+    tree = fractal_tree.FractalTree(backend=backend)
+    for level in range(5):
+        tree.advance()
+    tree.reset()
+    backend.run_jobs()
+    assert len(tree.canvas.find_all()) == 1
+    assert len(tree.rule.rows) == 1
@@ -0,0 +1,119 @@
+"""
+File: tree_export.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Saves the fractal tree as SVG, PNG or PPM without opening a window
+"""
+import argparse
+import math
+import struct
+import zlib
+import numpy as np
+import lsystem
+
+BACKGROUND = 255 # white, like the canvas
+LINE_COLOR = 0   # black, the default color of create_line
+
+
+def tree_chunks(depth, width=400, height=400, chunk_size=65536, rule=None):
+    """yield the segments of the tree grown with rule in chunks, placed the same way as in FractalTree"""
+    if rule is None:
+        rule = lsystem.LSystem()
+    return rule.iter_chunks(depth, width//2, height - 20, math.pi/2, height//3, chunk_size)
+
+
+def write_svg(path, depth, width=400, height=400, chunk_size=65536, rule=None):
+    """input: str: file name, int: deepest level, int: width, int: height, int: chunk size, LSystem: rule
+    write every branch to an SVG file one chunk at a time"""
+    with open(path, 'w') as f:
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+                f'viewBox="0 0 {width} {height}">\n')
+        f.write(f'<rect width="{width}" height="{height}" fill="white"/>\n')
+        for segments in tree_chunks(depth, width, height, chunk_size, rule):
+            #one path per chunk keeps the file much smaller than one <line> per branch
+            moves = ' '.join(f'M{x_1:g} {y_1:g}L{x_2:g} {y_2:g}' for x_1, y_1, x_2, y_2 in segments.tolist())
+            f.write(f'<path stroke="black" fill="none" d="{moves}"/>\n')
+        f.write('</svg>\n')
+
+
+def draw_segments(image, segments, color=LINE_COLOR):
+    """input: array: (height, width) image, array: (n, 4) segments, int: gray value
+    draw every segment in the image, one pixel per step along its longest side"""
+    x_1, y_1, x_2, y_2 = segments.T
+    steps = np.maximum(np.abs(x_2 - x_1), np.abs(y_2 - y_1)).astype(np.int64) + 1
+    owner = np.repeat(np.arange(len(segments)), steps)
+    step = np.arange(steps.sum()) - np.repeat(np.cumsum(steps) - steps, steps)
+    t = step / np.maximum(steps - 1, 1)[owner]
+    x = np.rint(x_1[owner] + (x_2 - x_1)[owner]*t).astype(np.int64)
+    y = np.rint(y_1[owner] + (y_2 - y_1)[owner]*t).astype(np.int64)
+
+    #branches can leave the canvas, those pixels are not drawn
+    height, width = image.shape
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    image[y[inside], x[inside]] = color
+
+
+def render_image(depth, width=400, height=400, chunk_size=65536, rule=None):
+    """input: int: deepest level, int: width, int: height, int: chunk size, LSystem: rule
+    return a (height, width) gray image of the tree"""
+    image = np.full((height, width), BACKGROUND, dtype=np.uint8)
+    for segments in tree_chunks(depth, width, height, chunk_size, rule):
+        draw_segments(image, segments)
+    return image
+
+
+def write_ppm(path, image, rows=256):
+    """input: str: file name, array: gray image
+    write the image as a binary PPM file"""
+    height, width = image.shape
+    with open(path, 'wb') as f:
+        f.write(b'P6\n%d %d\n255\n' % (width, height))
+        for start in range(0, height, rows):
+            f.write(np.repeat(image[start:start + rows], 3, axis=1).tobytes())
+
+
+def write_png(path, image, rows=256):
+    """input: str: file name, array: gray image
+    write the image as an 8 bit grayscale PNG file"""
+    height, width = image.shape
+
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    compressor = zlib.compressobj()
+    data = []
+    for start in range(0, height, rows):
+        #every row starts with filter type 0
+        block = image[start:start + rows]
+        data.append(compressor.compress(np.hstack((np.zeros((len(block), 1), np.uint8), block)).tobytes()))
+    data.append(compressor.flush())
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 0, 0, 0, 0)))
+        f.write(chunk(b'IDAT', b''.join(data)))
+        f.write(chunk(b'IEND', b''))
+
+
+def export(path, depth, width=400, height=400, chunk_size=65536, rule=None):
+    """input: str: file name, int: deepest level, int: width, int: height, int: chunk size, LSystem: rule
+    save the tree in the format given by the extension of the file name"""
+    if path.endswith('.svg'):
+        write_svg(path, depth, width, height, chunk_size, rule)
+    elif path.endswith('.png'):
+        write_png(path, render_image(depth, width, height, chunk_size, rule))
+    elif path.endswith('.ppm'):
+        write_ppm(path, render_image(depth, width, height, chunk_size, rule))
+    else:
+        raise ValueError(f"{path} must end in .svg, .png or .ppm")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Save the fractal tree without opening a window")
+    parser.add_argument('depth', type=int, help="deepest level of the tree")
+    parser.add_argument('path', help="output file, .svg, .png or .ppm")
+    parser.add_argument('--width', type=int, default=400)
+    parser.add_argument('--height', type=int, default=400)
+    parser.add_argument('--chunk-size', type=int, default=65536)
+    lsystem.add_arguments(parser)
+    args = parser.parse_args()
+    export(args.path, args.depth, args.width, args.height, args.chunk_size, lsystem.from_arguments(parser, args))
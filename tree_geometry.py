@@ -0,0 +1,72 @@
+"""
+File: tree_geometry.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Shape of the default fractal tree and a grid index to find its segments quickly,
+the segments themselves are grown by lsystem.py
+"""
+import math
+import numpy as np
+
+CHILD_BRANCH = 0.58       # length of a child branch compared to its parent
+BRANCH_ANGLE = math.pi/5  # angle between a child branch and its parent
+
+
+class SegmentGrid:
+    def __init__(self, segments, cells=64):
+        """input: array: (N, 4) segments, int: number of cells on each side of the grid
+        index the segments by the grid cell of their midpoint"""
+        self.cells = cells
+        lengths = np.hypot(segments[:, 2] - segments[:, 0], segments[:, 3] - segments[:, 1])
+        x_min = np.minimum(segments[:, 0], segments[:, 2])
+        x_max = np.maximum(segments[:, 0], segments[:, 2])
+        y_min = np.minimum(segments[:, 1], segments[:, 3])
+        y_max = np.maximum(segments[:, 1], segments[:, 3])
+
+        #grid over the bounding box of the whole tree
+        self.origin = np.array([x_min.min(), y_min.min()])
+        self.cell_size = np.maximum(np.array([x_max.max(), y_max.max()]) - self.origin, 1)/cells
+        middle = (segments[:, :2] + segments[:, 2:])/2
+        column, row = np.minimum(((middle - self.origin)//self.cell_size).astype(np.int64), cells - 1).T
+        cell = row*cells + column
+
+        #sort by cell and inside a cell from the longest segment to the shortest
+        order = np.lexsort((-lengths, cell))
+        self.segments = segments[order]
+        self.lengths = lengths[order]
+        self.boxes = np.column_stack((x_min, y_min, x_max, y_max))[order]
+        cell = cell[order]
+
+        #where every non empty cell starts and ends, and the box around all its segments
+        self.starts = np.flatnonzero(np.r_[True, cell[1:] != cell[:-1]])
+        self.ends = np.r_[self.starts[1:], len(cell)]
+        self.cell_boxes = np.column_stack((np.minimum.reduceat(self.boxes[:, 0], self.starts),
+                                           np.minimum.reduceat(self.boxes[:, 1], self.starts),
+                                           np.maximum.reduceat(self.boxes[:, 2], self.starts),
+                                           np.maximum.reduceat(self.boxes[:, 3], self.starts)))
+
+    def __len__(self):
+        return len(self.segments)
+
+    def query(self, x_min, y_min, x_max, y_max, min_length=0):
+        """input: double: viewport box, double: shortest length that is still returned
+        return the (n, 4) segments at least min_length long that touch the viewport"""
+        boxes = self.cell_boxes
+        visible = np.flatnonzero((boxes[:, 0] <= x_max) & (boxes[:, 2] >= x_min) &
+                                 (boxes[:, 1] <= y_max) & (boxes[:, 3] >= y_min) &
+                                 (self.lengths[self.starts] >= min_length))
+        if len(visible) == 0:
+            return np.empty((0, 4))
+
+        #the lengths in a cell go down, so the long enough segments are a prefix of the cell
+        slices = []
+        for index in visible:
+            start, end = self.starts[index], self.ends[index]
+            end = start + np.searchsorted(-self.lengths[start:end], -min_length, side='right')
+            slices.append(np.arange(start, end))
+        candidates = np.concatenate(slices)
+
+        boxes = self.boxes[candidates]
+        inside = ((boxes[:, 0] <= x_max) & (boxes[:, 2] >= x_min) &
+                  (boxes[:, 1] <= y_max) & (boxes[:, 3] >= y_min))
+        return self.segments[candidates[inside]]
@@ -0,0 +1,124 @@
+"""
+File: tree_parallel.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Generates the subtrees of a deep fractal tree in a pool of processes
+"""
+import argparse
+import math
+import multiprocessing
+import time
+import weakref
+from multiprocessing import shared_memory
+import numpy as np
+import lsystem
+
+
+def build_subtrees(name, total, offset, frontier, level, depth, rule):
+    """input: str: shared memory name, int: segments in the buffer, int: first row to write,
+    tuple: frontier of the subtrees, int: level of their trunks, int: levels in every subtree, LSystem: rule
+    write the segments of the subtrees in the shared buffer, level by level from offset"""
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        segments = np.ndarray((total, 4), dtype=np.float64, buffer=memory.buf)
+        for level in range(level, level + depth + 1):
+            level_segments, frontier = rule.next_level(frontier, level)
+            segments[offset:offset + len(level_segments)] = level_segments
+            offset += len(level_segments)
+            del level_segments
+        del segments
+    finally:
+        memory.close()
+
+
+def parallel_tree_segments(depth, x, y, angle, length, processes=None, split_level=None, rule=None):
+    """input: int: deepest level, double: x, double: y, double: angle, double: length,
+    int: number of processes, int: level where the tree is split in subtrees, LSystem: rule
+    return the same (N, 4) segments as rule.segments, possibly in another order"""
+    if rule is None:
+        rule = lsystem.LSystem()
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    if split_level is None:
+        #a few subtrees per process so a slow process does not hold the others back
+        split_level = math.ceil(math.log(4*processes, len(rule))) if len(rule) > 1 else 0
+    split_level = max(0, min(split_level, depth))
+    total = rule.segment_count(depth)
+
+    memory = shared_memory.SharedMemory(create=True, size=total*4*8)
+    segments = None
+    try:
+        segments = np.ndarray((total, 4), dtype=np.float64, buffer=memory.buf)
+
+        #the levels above the split are small, they are built here
+        frontier = rule.trunk(x, y, angle, length)
+        offset = 0
+        for level in range(split_level):
+            level_segments, frontier = rule.next_level(frontier, level)
+            segments[offset:offset + len(level_segments)] = level_segments
+            offset += len(level_segments)
+
+        #every process gets a range of subtrees and the rows where they go
+        subtree_size = rule.segment_count(depth - split_level)
+        subtrees = len(frontier[0])
+        batch = max(1, subtrees//(4*processes))
+        tasks = []
+        for start in range(0, subtrees, batch):
+            end = min(start + batch, subtrees)
+            tasks.append((memory.name, total, offset + start*subtree_size,
+                          tuple(part[start:end] for part in frontier),
+                          split_level, depth - split_level, rule))
+        if processes == 1:
+            for task in tasks:
+                build_subtrees(*task)
+        else:
+            with multiprocessing.Pool(processes) as pool:
+                pool.starmap(build_subtrees, tasks)
+    except BaseException:
+        segments = None
+        memory.close()
+        raise
+    finally:
+        #the workers are done with the name, the block itself lives until it is closed
+        memory.unlink()
+
+    #the segments are returned in the shared block instead of a copy, which would double the memory,
+    #the block is closed when the array and every view of it are released
+    weakref.finalize(segments, memory.close)
+    return segments
+
+
+def benchmark(depths, process_counts, repeat=3, rule=None):
+    """input: list: depths, list: process counts, int: runs of every case, LSystem: rule
+    print the best time of the serial generator and of every process count"""
+    if rule is None:
+        rule = lsystem.LSystem()
+    x, y, angle, length = 200, 380, math.pi/2, 400//3
+    print(f"{'depth':>5} {'segments':>10} {'serial':>9}" + ''.join(f" {str(count) + ' proc':>9}" for count in process_counts))
+    for depth in depths:
+        times = []
+        for processes in [None] + process_counts:
+            best = math.inf
+            for run in range(repeat):
+                start = time.perf_counter()
+                if processes is None:
+                    segments = rule.segments(depth, x, y, angle, length)
+                    #every run builds the memoized subtrees again
+                    rule.clear()
+                else:
+                    segments = parallel_tree_segments(depth, x, y, angle, length, processes, rule=rule)
+                best = min(best, time.perf_counter() - start)
+                del segments
+            times.append(best)
+        print(f"{depth:>5} {rule.segment_count(depth):>10}" + ''.join(f" {t:>8.3f}s" for t in times))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the parallel tree generator against the serial one")
+    parser.add_argument('--depths', type=int, nargs='+', default=[18, 20, 22, 24])
+    parser.add_argument('--processes', type=int, nargs='+',
+                        default=sorted({1, 2, 4, 8, multiprocessing.cpu_count()}))
+    parser.add_argument('--repeat', type=int, default=3)
+    lsystem.add_arguments(parser)
+    args = parser.parse_args()
+    benchmark(args.depths, args.processes, args.repeat, lsystem.from_arguments(parser, args))
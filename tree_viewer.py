@@ -0,0 +1,149 @@
+"""
+File: tree_viewer.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Zoom into and pan across a deep fractal tree
+"""
+import argparse
+import math
+import numpy as np
+import backends
+import lsystem
+import tree_geometry
+
+class TreeViewer:
+    def __init__(self, depth=18, rule=None, backend=None):
+        """ Initialize the viewer and index every branch of the tree.
+        rule is the LSystem the tree grows with, by default the one of FractalTree.
+        backend draws the window, by default with tkinter. """
+
+        #instance variables
+        self.tk = backend or backends.TkBackend()
+        self.window = self.tk.Tk()
+        self.window.title("Fractal Tree Viewer")
+        self.canvas_width = 400
+        self.canvas_height = 400
+        self.button_Width = 14
+        self.depth = depth
+        self.ZOOM_STEP = 1.25 #how much one turn of the mouse wheel zooms
+        self.MIN_PIXELS = 1 #branches shorter than this on screen are not drawn
+        self.MAX_LINES = 20000 #most lines drawn in one frame
+        self.scale = 1.0
+        self.offset_x = 0.0 #world point shown at the top left corner of the canvas
+        self.offset_y = 0.0
+        self.drag_x = 0
+        self.drag_y = 0
+        self.redraw_job = None
+
+        self.rule = rule
+        if self.rule is None:
+            self.rule = lsystem.LSystem()
+        segments = np.concatenate(list(self.rule.iter_chunks(self.depth, self.canvas_width//2, self.canvas_height - 20,
+                                                             math.pi/2, self.canvas_height//3)))
+        self.grid = tree_geometry.SegmentGrid(segments)
+
+        #make the canvas
+        self.canvas = self.tk.Canvas(self.window,
+                width = self.canvas_width,
+                height = self.canvas_height,
+                bg = 'white')
+        self.canvas.grid(row=1,column=1)
+        self.canvas.bind('<ButtonPress-1>', self.start_drag)
+        self.canvas.bind('<B1-Motion>', self.drag)
+        self.canvas.bind('<MouseWheel>', self.wheel)
+        self.canvas.bind('<Button-4>', self.wheel)
+        self.canvas.bind('<Button-5>', self.wheel)
+
+        #Buttons created
+        self.button_Frame = self.tk.Frame(self.window,width=self.canvas_width,height=self.canvas_height)
+        self.button_Frame.grid(row=2,column=1)
+
+        self.reset_button = self.tk.Button(self.button_Frame, bg = 'white', command = self.reset, text = 'Reset',width = self.button_Width)
+        self.reset_button.grid(row=2,column=1)
+
+        self.quit_button = self.tk.Button(self.button_Frame, bg = 'white', command = self.quit, text = 'Quit',width = self.button_Width)
+        self.quit_button.grid(row=2,column=2)
+
+        #Shows the zoom and how many lines are on the canvas
+        self.status = self.tk.StringVar()
+        self.status_label = self.tk.Label(self.button_Frame, textvariable = self.status)
+        self.status_label.grid(row=3,column=1,columnspan=2)
+
+        self.redraw()
+
+        self.window.mainloop()
+
+    def start_drag(self, event):
+        """Remember where the mouse was pressed"""
+        self.drag_x = event.x
+        self.drag_y = event.y
+
+    def drag(self, event):
+        """Move the view with the mouse"""
+        self.offset_x -= (event.x - self.drag_x)/self.scale
+        self.offset_y -= (event.y - self.drag_y)/self.scale
+        self.start_drag(event)
+        self.schedule_redraw()
+
+    def wheel(self, event):
+        """Zoom in or out keeping the point under the mouse in place"""
+        if event.num == 4 or event.delta > 0:
+            factor = self.ZOOM_STEP
+        else:
+            factor = 1/self.ZOOM_STEP
+        self.offset_x += event.x/self.scale*(1 - 1/factor)
+        self.offset_y += event.y/self.scale*(1 - 1/factor)
+        self.scale *= factor
+        self.schedule_redraw()
+
+    def reset(self):
+        """Show the whole tree again"""
+        self.scale = 1.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.schedule_redraw()
+
+    def quit(self):
+        """Terminate program"""
+        if self.redraw_job is not None:
+            self.window.after_cancel(self.redraw_job)
+        self.window.destroy()
+
+    def schedule_redraw(self):
+        """Redraw once the window is idle, so many mouse events only cost one redraw"""
+        if self.redraw_job is None:
+            self.redraw_job = self.window.after_idle(self.redraw)
+
+    def visible_segments(self):
+        """return the segments inside the view that are long enough to see, in canvas coordinates"""
+        segments = self.grid.query(self.offset_x, self.offset_y,
+                                   self.offset_x + self.canvas_width/self.scale,
+                                   self.offset_y + self.canvas_height/self.scale,
+                                   self.MIN_PIXELS/self.scale)
+        if len(segments) > self.MAX_LINES:
+            #keep the longest ones, they are the ones that show the shape
+            lengths = (segments[:, 2] - segments[:, 0])**2 + (segments[:, 3] - segments[:, 1])**2
+            segments = segments[lengths.argsort()[-self.MAX_LINES:]]
+        segments = segments - (self.offset_x, self.offset_y, self.offset_x, self.offset_y)
+        return segments*self.scale
+
+    def redraw(self):
+        """Draw only the visible branches"""
+        self.redraw_job = None
+        self.canvas.delete("all")
+        segments = self.visible_segments()
+        for x_1,y_1,x_2,y_2 in segments.tolist():
+            self.canvas.create_line(x_1,y_1,x_2,y_2)
+        self.status.set(f"Zoom {self.scale:.4g}x: {len(segments)} of {len(self.grid)} lines drawn")
+
+
+def main(arguments=None, backend=None):
+    parser = argparse.ArgumentParser(description="Zoom into and pan across a deep fractal tree")
+    parser.add_argument('depth', type=int, nargs='?', default=18, help="deepest level of the tree")
+    lsystem.add_arguments(parser)
+    args = parser.parse_args(arguments)
+    TreeViewer(args.depth, lsystem.from_arguments(parser, args), backend)
+
+
+if __name__ == "__main__":
+    main()
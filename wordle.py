@@ -6,20 +6,19 @@ Description: A Python/tkinter implementation of wordle.
 """
 
 # Imports
-from cgitb import reset
+import argparse
 import random
-import tkinter as tk
-import tkinter.font as font
+import backends
 from enum import Enum
 import time
-from numpy import corrcoef, row_stack
 from functools import reduce
 import operator
 
 class Wordy:
-    def __init__(self):
-        # Create window
-        self.window = tk.Tk()
+    def __init__(self, backend=None):
+        # Create window, backend draws it and is tkinter by default
+        self.tk = backend or backends.TkBackend()
+        self.window = self.tk.Tk()
         self.window.title("Wordy")
 
         """ Initialize the game """
@@ -31,7 +30,7 @@ class Wordy:
         self.PADDING = 10 # Padding around widgets
         self.ENTRY_SIZE = 10 # Size of entry widget
         self.FONT_FAMILY = 'ariel'
-        self.FONT = font.Font(family=self.FONT_FAMILY)
+        self.FONT = self.tk.Font(family=self.FONT_FAMILY)
 
         # Size of the frame that holds all guesses.  This is the upper left
         # frame in the window.
@@ -126,7 +125,7 @@ class Wordy:
                                         # updating successive frames.
 
         # Create a guess_frame  as the upper top frame.
-        self.guess_frame = tk.Frame(self.window, 
+        self.guess_frame = self.tk.Frame(self.window, 
             borderwidth = 1, relief = 'solid',
             height = self.PARENT_GUESS_FRAME_HEIGHT, 
             width = self.PARENT_GUESS_FRAME_WIDTH)
@@ -134,34 +133,34 @@ class Wordy:
         self.guess_frame.grid_propagate(False)
 
         # Create a keyboard_frame as the lower left frame.
-        self.keyboard_frame = tk.Frame(self.window, 
+        self.keyboard_frame = self.tk.Frame(self.window, 
             borderwidth = 1, relief = 'solid',
             height = self.KEYBOARD_FRAME_HEIGHT, width = self.PARENT_GUESS_FRAME_WIDTH)
         self.keyboard_frame.grid(row = 2, column = 1)
         self.keyboard_frame.grid_propagate(False)
 
         # Create a control_frame as the right frame.
-        self.control_frame = tk.Frame(self.window, 
+        self.control_frame = self.tk.Frame(self.window, 
             height = self.CONTROL_FRAME_HEIGHT, width = self.CONTROL_FRAME_WIDTH)
         self.control_frame.grid(row = 1, column = 2, rowspan = 3)
         self.control_frame.grid_propagate(False)
 
         # Create a message_frame as the upper frame inside control_frame.
-        self.message_frame = tk.Frame(self.control_frame, 
+        self.message_frame = self.tk.Frame(self.control_frame, 
             borderwidth = 1, relief = 'solid',
             height = self.CONTROL_FRAME_HEIGHT//3, width = self.CONTROL_FRAME_WIDTH)
         self.message_frame.grid(row = 1, column = 2)
         self.message_frame.grid_propagate(False)
 
         # Create a parameter_frame as the middle frame inside control_frame.
-        self.parameter_frame = tk.Frame(self.control_frame, 
+        self.parameter_frame = self.tk.Frame(self.control_frame, 
             borderwidth = 1, relief = 'solid',
             height = self.CONTROL_FRAME_HEIGHT//3, width = self.CONTROL_FRAME_WIDTH)
         self.parameter_frame.grid(row = 2, column = 2)
         self.parameter_frame.grid_propagate(False)
         
         # Create a button_frame as the low frame inside control_frame.
-        self.button_frame = tk.Frame(self.control_frame, 
+        self.button_frame = self.tk.Frame(self.control_frame, 
             borderwidth = 1, relief = 'solid',
             height = self.CONTROL_FRAME_HEIGHT//3, width = self.CONTROL_FRAME_WIDTH)
         self.button_frame.grid(row = 3, column = 2)
@@ -169,13 +168,13 @@ class Wordy:
 
                 # Start event loop
         # Put a button in the bottom frame
-        self.start_button  = tk.Button(self.button_frame, text = "Start Game", command = self.check_errors)
+        self.start_button  = self.tk.Button(self.button_frame, text = "Start Game", command = self.check_errors)
         #self.start_button.pack(side=tk.RIGHT,expand=True)
         self.start_button.grid(row = 1, column = 1)
 
 
         # Put a button in the bottom frame
-        self.quit_button  = tk.Button(self.button_frame, text = "Quit", command=self.quit)
+        self.quit_button  = self.tk.Button(self.button_frame, text = "Quit", command=self.quit)
         #self.quit_button.pack(side=tk.RIGHT, expand=True)
         self.quit_button.grid(row = 1, column = 2)
 
@@ -186,51 +185,51 @@ class Wordy:
 
          # Put a checkbox in the top frame.  Make the default
          # on.
-        self.hardmode_var = tk.BooleanVar()
+        self.hardmode_var = self.tk.BooleanVar()
         self.hardmode_var.set(False)
-        self.hardmode = tk.Checkbutton(self.parameter_frame, text="Hard mode", 
+        self.hardmode = self.tk.Checkbutton(self.parameter_frame, text="Hard mode", 
                             var = self.hardmode_var)
-        self.hardmode.grid(row = 1, column = 1, sticky = tk.W, padx = self.USER_SELECTION_PADDING)
+        self.hardmode.grid(row = 1, column = 1, sticky = self.tk.W, padx = self.USER_SELECTION_PADDING)
 
         # Put a checkbox in the top frame.  Make the default
          # on.
-        self.guesses_var = tk.BooleanVar()
+        self.guesses_var = self.tk.BooleanVar()
         self.guesses_var.set(True)
 
         self.game_over = False
 
-        self.hidden_word = tk.StringVar()
+        self.hidden_word = self.tk.StringVar()
     
-        self.guesses = tk.Checkbutton(self.parameter_frame, text="Guesses must be words", 
+        self.guesses = self.tk.Checkbutton(self.parameter_frame, text="Guesses must be words", 
                             var = self.guesses_var, onvalue=True, offvalue=False)
-        self.guesses.grid(row = 2, column = 1, sticky = tk.W, padx = self.USER_SELECTION_PADDING)
+        self.guesses.grid(row = 2, column = 1, sticky = self.tk.W, padx = self.USER_SELECTION_PADDING)
 
         # Put a checkbox in the top frame.  Make the default
          # on.
-        self.showword_var = tk.BooleanVar()
+        self.showword_var = self.tk.BooleanVar()
         self.showword_var.set(False)
-        self.show_word = tk.Checkbutton(self.parameter_frame, text="Show word", 
+        self.show_word = self.tk.Checkbutton(self.parameter_frame, text="Show word", 
                             var = self.showword_var, onvalue=True, offvalue=False, command=self.show_hidden_word)
-        self.show_word.grid(row = 3, column = 1, sticky = tk.W, padx = self.USER_SELECTION_PADDING)
+        self.show_word.grid(row = 3, column = 1, sticky = self.tk.W, padx = self.USER_SELECTION_PADDING)
 
-        self.show_word_label = tk.Label(self.parameter_frame, textvariable=self.hidden_word)
+        self.show_word_label = self.tk.Label(self.parameter_frame, textvariable=self.hidden_word)
 
         # Put a checkbox in the top frame.  Make the default
          # on.
-        self.specifyword_var = tk.BooleanVar()
+        self.specifyword_var = self.tk.BooleanVar()
         self.specifyword_var.set(False)
-        self.specify_word = tk.Checkbutton(self.parameter_frame, text="Specify word", 
+        self.specify_word = self.tk.Checkbutton(self.parameter_frame, text="Specify word", 
                             var = self.specifyword_var, onvalue=True, offvalue=False)
-        self.specify_word.grid(row = 4, column = 1, sticky = tk.W, padx = self.USER_SELECTION_PADDING)
+        self.specify_word.grid(row = 4, column = 1, sticky = self.tk.W, padx = self.USER_SELECTION_PADDING)
 
         # Put an entry widget to the right
-        self.entry_var = tk.StringVar()
-        self.entry  = tk.Entry(self.parameter_frame, textvariable=self.entry_var, width = self.WORD_SIZE)
+        self.entry_var = self.tk.StringVar()
+        self.entry  = self.tk.Entry(self.parameter_frame, textvariable=self.entry_var, width = self.WORD_SIZE)
         self.entry.grid(row = 4, column=2, padx = self.WORD_SIZE)
 
         #Shows Label Error
-        self.error_message = tk.StringVar()
-        self.error_label = tk.Label(self.message_frame, textvariable=self.error_message)
+        self.error_message = self.tk.StringVar()
+        self.error_label = self.tk.Label(self.message_frame, textvariable=self.error_message)
 
         # Center the frame in the window
         self.window.rowconfigure(0, weight = 1)
@@ -277,7 +276,7 @@ class Wordy:
         #Create squares in guess frame
         for r in range(len(self.guess_frame_squares)):
             for c in range(len(self.guess_frame_squares[r])):
-                square_guess = tk.Frame(self.guess_frame, borderwidth = 1, relief = 'solid',
+                square_guess = self.tk.Frame(self.guess_frame, borderwidth = 1, relief = 'solid',
                         width = self.GUESS_FRAME_SIZE, height=self.GUESS_FRAME_SIZE,bg = self.GUESS_FRAME_BG_BEGIN)
                 square_guess.grid(row = r + 1, column = c + 1, padx=self.GUESS_FRAME_PADDING, 
                 pady=self.GUESS_FRAME_PADDING)
@@ -302,14 +301,14 @@ class Wordy:
             # Create a keyboard_frame as the lower left frame.
             #Checks if it is the first or last frame
             if r==0 or r ==2:
-                self.innerkeyboard_frame = tk.Frame(self.keyboard_frame, 
+                self.innerkeyboard_frame = self.tk.Frame(self.keyboard_frame, 
                     height = self.KEYBOARD_FRAME_HEIGHT//3, width = self.PARENT_GUESS_FRAME_WIDTH)
                 self.innerkeyboard_frame.grid(row = r, column = 0)
                 self.innerkeyboard_frame.grid_propagate(False)
                 self.innerkeyboard_frame.columnconfigure(0, weight = 1)
             #Checks if it is the middle frame
             if r==1:
-                self.innerkeyboard_frame = tk.Frame(self.keyboard_frame, 
+                self.innerkeyboard_frame = self.tk.Frame(self.keyboard_frame, 
                     height = 30, width = self.PARENT_GUESS_FRAME_WIDTH)
                 self.innerkeyboard_frame.grid(row = r, column = 0)
                 self.innerkeyboard_frame.grid_propagate(False)
@@ -321,7 +320,7 @@ class Wordy:
                 size = self.KEYBOARD_BUTTON_WIDTH
                 if self.KEYBOARD_BUTTON_NAMES[r][c] == "ENTER" or self.KEYBOARD_BUTTON_NAMES[r][c] == "BACK":
                     size = self.KEYBOARD_BUTTON_WIDTH_LONG
-                button = tk.Button(self.innerkeyboard_frame,
+                button = self.tk.Button(self.innerkeyboard_frame,
                         width = size,
                         text = self.KEYBOARD_BUTTON_NAMES[r][c],
                         bg=self.KEYBOARD_BUTTON_BG_BEGIN, 
@@ -355,7 +354,7 @@ class Wordy:
             self.column_squares = len(self.guess_labels_list)
             letter = text
             self.guess_frame_squares[self.row_squares][self.column_squares] = letter
-            self.letter_label = tk.Label(self.guess_frame, text=letter, font=(self.FONT, self.FONT_SIZE_GUESS), bg= 'white', fg='black')
+            self.letter_label = self.tk.Label(self.guess_frame, text=letter, font=(self.FONT, self.FONT_SIZE_GUESS), bg= 'white', fg='black')
             self.letter_label.grid(row=self.row_squares+1,column=self.column_squares+1, padx=self.GUESS_FRAME_PADDING, 
                     pady=self.GUESS_FRAME_PADDING)
             self.guess_labels_list.append(self.letter_label)
@@ -794,5 +793,11 @@ class Wordy:
         self.window.destroy()
 
 
+def main(arguments=None, backend=None):
+   #Wordy has no options, but anything given is still an error instead of being ignored
+   argparse.ArgumentParser(description="Play Wordy").parse_args(arguments)
+   Wordy(backend)
+
+
 if __name__ == "__main__":
-   Wordy()
+   main()
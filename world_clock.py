@@ -0,0 +1,143 @@
+"""
+File: world_clock.py
+Author: Eduardo Pérez
+Date: 10/19/26
+Description: Displays many clocks, one per time zone, in one window with one tick loop
+"""
+import argparse
+import datetime
+import math
+import time
+import zoneinfo
+import numpy as np
+import backends
+import clock_geometry
+from display_clock import TickStats
+
+class WorldClock:
+    def __init__(self, zones, face_size=None, backend=None):
+        """
+        Constructor for WorldClock class. zones is a list of time zone names,
+        every one gets its own face in a grid on a single canvas.
+        backend draws the window, by default with tkinter.
+        """
+        self.tk = backend or backends.TkBackend()
+        self.window = self.tk.Tk() # Create a window
+        self.window.title("World Clock")
+        self.zones = [zoneinfo.ZoneInfo(zone) for zone in zones]
+        self.columns = math.ceil(math.sqrt(len(self.zones)))
+        self.rows = math.ceil(len(self.zones) / self.columns)
+        if face_size is None:
+            face_size = max(60, min(200, 1000 // self.columns))
+        self.face_size = face_size
+        self.canvas_width = self.columns * self.face_size
+        self.canvas_height = self.rows * self.face_size
+        self.button_width = 8
+        self.radius_percentage = 0.7
+        self.radius = self.radius_percentage * 0.5 * self.face_size
+        self.TICK_MARGIN = 0.002 # seconds after the boundary the tick is scheduled, so it never runs early
+        self.tick_job = None
+        self.next_tick = time.time()
+        self.stats = TickStats()
+
+        #UTC offset of every face, refreshed every minute to follow daylight saving time
+        self.offsets = []
+        self.offsets_minute = None
+
+        #Create Canvas
+        self.canvas = self.tk.Canvas(self.window,
+                width = self.canvas_width,
+                height = self.canvas_height,
+                bg = 'white')
+        self.canvas.grid(row = 1, column = 1)
+
+        #Create buttons and place them in a frame
+        self.button_frame = self.tk.Frame(self.window)
+        self.button_frame.grid(row=2, column=1)
+        self.quit_button = self.tk.Button(self.button_frame, bg = 'white', command = self.quit,
+                                        text = "Quit", width=self.button_width)
+        self.quit_button.grid(row = 1, column = 1, pady=5)
+
+        #Faces, every one with its center and its hands
+        self.centers = []
+        self.hands = []
+        for index, zone in enumerate(zones):
+            center_x = (index % self.columns) * self.face_size + self.face_size // 2
+            center_y = (index // self.columns) * self.face_size + self.face_size // 2
+            self.canvas.create_oval(center_x - self.radius, center_y - self.radius, center_x + self.radius, center_y + self.radius, fill = "white")
+            self.canvas.create_text(center_x, center_y + self.radius + 7, text = zone.split('/')[-1].replace('_', ' '))
+            self.centers.append((center_x, center_y))
+            self.hands.append((self.canvas.create_line(center_x, center_y, center_x, center_y, fill = "green"),
+                               self.canvas.create_line(center_x, center_y, center_x, center_y, fill = "blue"),
+                               self.canvas.create_line(center_x, center_y, center_x, center_y, fill = "red")))
+
+        #the model moves every face in one call, a hand is only redrawn when its end moves a pixel
+        self.centers_x = np.array([center_x for center_x, center_y in self.centers], dtype=float)
+        self.centers_y = np.array([center_y for center_x, center_y in self.centers], dtype=float)
+        self.shown_pixels = None
+
+        self.time_display()
+
+        self.window.mainloop()
+
+    def refresh_offsets(self, utc_seconds):
+        """Gets the UTC offset of every face for the current minute"""
+        now = datetime.datetime.fromtimestamp(utc_seconds, datetime.timezone.utc)
+        self.offsets = np.array([now.astimezone(zone).utcoffset().total_seconds() for zone in self.zones])
+        self.offsets_minute = utc_seconds // 60
+
+    def time_display(self):
+        """Moves the hands that changed on every face, one tick for all the clocks"""
+        started = time.time()
+        started_cost = time.perf_counter()
+        self.tick_job = None
+        utc_seconds = int(started)
+        if utc_seconds // 60 != self.offsets_minute:
+            self.refresh_offsets(utc_seconds)
+
+        #end points of the hour, minute and second hands of every face, shape (faces, 3, 2)
+        endpoints = clock_geometry.hand_endpoints_array(utc_seconds + self.offsets, self.centers_x,
+                                                        self.centers_y, self.radius)
+        pixels = np.rint(endpoints).astype(np.int64)
+        if self.shown_pixels is None:
+            changed = np.ones(pixels.shape[:2], dtype=bool)
+        else:
+            changed = (pixels != self.shown_pixels).any(axis=2)
+        self.shown_pixels = pixels
+        for index, hand in zip(*np.nonzero(changed)):
+            center_x, center_y = self.centers[index]
+            end_x, end_y = endpoints[index, hand].tolist()
+            self.canvas.coords(self.hands[index][hand], center_x, center_y, end_x, end_y)
+
+        self.stats.record(self.next_tick, started, started + time.perf_counter() - started_cost)
+        self.schedule_tick()
+
+    def schedule_tick(self):
+        """Schedules the next tick right after the next wall clock second"""
+        self.next_tick = math.floor(time.time()) + 1
+        delay = self.next_tick + self.TICK_MARGIN - time.time()
+        self.tick_job = self.window.after(max(0, math.ceil(delay * 1000)), self.time_display)
+
+    def quit(self):
+        """Exits the program"""
+        if self.tick_job is not None:
+            self.window.after_cancel(self.tick_job)
+        print(self.stats.summary())
+        self.window.destroy()
+
+def main(arguments=None, backend=None):
+    parser = argparse.ArgumentParser(description="Display a clock for every time zone")
+    parser.add_argument('zones', nargs='*', help="time zone names, like America/New_York")
+    parser.add_argument('--count', type=int, default=24, help="number of zones when none are given")
+    parser.add_argument('--face-size', type=int, default=None)
+    args = parser.parse_args(arguments)
+    zones = args.zones
+    if not zones:
+        #spread the zones over the whole list instead of taking only the first ones
+        zones = sorted(zone for zone in zoneinfo.available_timezones() if '/' in zone)
+        zones = zones[::max(1, len(zones) // args.count)][:args.count]
+    WorldClock(zones, args.face_size, backend)
+
+
+if __name__ == "__main__":
+    main()